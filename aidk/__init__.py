@@ -10,14 +10,26 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __license__ = "MIT"
 
-from pathlib import Path
+# Package data directories, relative to the package root. They are resolved
+# to Path objects on first access (PEP 562) so `import aidk` stays cheap.
+_PATH_PARTS = {
+    "PACKAGE_ROOT": (),
+    "DATA_DIR": ("data",),
+    "SKILLS_DIR": ("data", "skills"),
+    "TEMPLATES_DIR": ("data", "templates"),
+    "EXAMPLES_DIR": ("data", "examples"),
+}
 
-# Package root directory
-PACKAGE_ROOT = Path(__file__).parent
-DATA_DIR = PACKAGE_ROOT / "data"
-SKILLS_DIR = DATA_DIR / "skills"
-TEMPLATES_DIR = DATA_DIR / "templates"
-EXAMPLES_DIR = DATA_DIR / "examples"
+
+def __getattr__(name):
+    if name in _PATH_PARTS:
+        from pathlib import Path
+
+        root = Path(__file__).parent
+        paths = {key: root.joinpath(*parts) for key, parts in _PATH_PARTS.items()}
+        globals().update(paths)
+        return paths[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "__version__",
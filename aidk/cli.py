@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Android AI Development Kit - Unified CLI
 
@@ -10,22 +9,151 @@ Provides a unified command-line interface for all AIDK tools:
 - Validate SPECs
 """
 
+import functools
+import importlib
+import os
+import re
 import sys
 import click
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-# Import AIDK modules
 from aidk import __version__
-from aidk.updater import check_for_updates, perform_update
-from aidk.installer import install_to_project, list_skills
 
-console = Console()
+# Rich and the AIDK submodules are imported lazily inside the commands that
+# need them, so `aidk --help` / `aidk --version` stay cheap.
+_console_instance = None
+
+# Panels and tables are only rendered for terminals; pipes get plain text.
+_IS_TTY = sys.stdout.isatty()
+_MARKUP_TAG = re.compile(r'\[/?[a-z][a-z ]*\]')
+
+# Headers that are the same on every run; see _header()
+_HEADERS = {
+    'install': "📦 [bold cyan]Installing Android AI Development Kit[/bold cyan]",
+    'update': "🔄 [bold cyan]Checking for Updates[/bold cyan]",
+    'version': (
+        "[bold cyan]Android AI Development Kit[/bold cyan]\n"
+        f"Version: [green]{__version__}[/green]"
+    ),
+    'skills': "📚 [bold cyan]Available Android Skills[/bold cyan]",
+    'info': (
+        "[bold cyan]Android AI Development Kit (AIDK)[/bold cyan]\n"
+        f"Version: [green]{__version__}[/green]"
+    ),
+}
+
+
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
+
+
+def _cached_import(module_path, attr):
+    """Return *attr* from *module_path*, checking sys.modules before importing."""
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    return getattr(module, attr)
+
+
+class _LazyGroup(click.Group):
+    """Click group whose commands are built the first time they are looked up.
+
+    ``lazy_commands`` maps a command name to ``(registrar, subcommands)``.
+    The registrar attaches the command to the group and returns it; a
+    nested group is given *subcommands* as its own ``lazy_commands``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = {}
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        command = self.commands.get(cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            register, subcommands = self.lazy_commands[cmd_name]
+            command = register(self)
+            if subcommands:
+                command.lazy_commands = subcommands
+        return command
+
+
+def _banner(message, style="cyan"):
+    """Print a header panel on terminals, or the bare message when piped."""
+    if _IS_TTY:
+        from rich.panel import Panel
+        _console().print(Panel.fit(message, border_style=style))
+    else:
+        print(_MARKUP_TAG.sub('', message))
+
 
+@functools.lru_cache(maxsize=None)
+def _render_header(name):
+    """Render the fixed header *name* to a string once per process."""
+    from rich.panel import Panel
 
-@click.group()
+    console = _console()
+    with console.capture() as capture:
+        console.print(Panel.fit(_HEADERS[name], border_style="cyan"))
+    return capture.get()
+
+
+def _header(name):
+    """Print one of the fixed `_HEADERS`, pre-rendered on terminals."""
+    if _IS_TTY:
+        sys.stdout.write(_render_header(name))
+    else:
+        print(_MARKUP_TAG.sub('', _HEADERS[name]))
+
+
+# Multi-line messages as (text, style) segments for rich.text.Text.assemble,
+# so they skip Rich's markup parser; see _styled()
+_STYLED_MESSAGES = {
+    'install_done': (
+        "✅ ", ("Installation completed successfully!", "green"),
+        "\n\n💡 ", ("Next steps:", "yellow"),
+        "\n  1. Run: ", ("aidk spec create 'Your Feature Name'", "cyan"),
+        "\n  2. Open your project in Claude Code",
+        "\n  3. All 36 Android skills are now available!",
+    ),
+    'install_global': (
+        "ℹ️  AIDK is already installed globally via pip.",
+        "\n\n💡 To install skills to a project, run:",
+        "\n  ", ("cd your-android-project", "cyan"),
+        "\n  ", ("aidk install --local", "cyan"),
+    ),
+    'quick_start': (
+        "\n💡 ", ("Quick Start:", "yellow"),
+        "\n  ", ("aidk install --local", "cyan"), "        # Install skills to current project",
+        "\n  ", ("aidk spec create 'Feature'", "cyan"), "  # Create a new SPEC",
+        "\n  ", ("aidk skills", "cyan"), "                 # List all available skills",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _styled(name):
+    """Return one of the `_STYLED_MESSAGES` as a Rich Text, built once."""
+    from rich.text import Text
+
+    return Text.assemble(*_STYLED_MESSAGES[name])
+
+
+def _require_file(path):
+    """Exit with Click's usage-error status if *path* is not an existing file."""
+    if not os.path.isfile(path):
+        _console().print(f"❌ [red]File not found: {path}[/red]")
+        sys.exit(2)
+
+
+@click.group(cls=_LazyGroup, no_args_is_help=True)
 @click.version_option(version=__version__, prog_name="Android AI DevKit")
 @click.pass_context
 def cli(ctx):
@@ -34,286 +162,357 @@ def cli(ctx):
 
     SPEC-First Android development framework with 36 specialized skills,
     automated SPEC generation, code generation, and documentation sync.
+
+    The background update check only runs in interactive terminals. It is
+    skipped when the CI or AIDK_NO_UPDATE_CHECK environment variable is set.
     """
-    # Check for updates in the background (cached for 24 hours)
-    if ctx.invoked_subcommand not in ['update', 'version']:
+    # Check for updates in the background (cached for 1 hour to 7 days)
+    if (
+        ctx.invoked_subcommand not in ('update', 'version')
+        and sys.stdout.isatty()
+        and 'CI' not in os.environ
+        and 'AIDK_NO_UPDATE_CHECK' not in os.environ
+    ):
+        from aidk.updater import check_for_updates
+
         try:
             check_for_updates(silent=True)
-        except Exception:
+        except (OSError, ValueError, ImportError):
             # Silently ignore update check failures
             pass
 
 
-@cli.command()
-@click.option('--local', is_flag=True, help='Install to current project (.claude/ directory)')
-@click.option('--global', 'global_install', is_flag=True, help='Install globally (default)')
-@click.option('--with-examples', is_flag=True, help='Include example SPECs and generated code')
-@click.option('--force', is_flag=True, help='Overwrite existing files')
-def install(local, global_install, with_examples, force):
-    """Install AIDK skills and tools to a Claude Code project."""
-    console.print(Panel.fit(
-        "📦 [bold cyan]Installing Android AI Development Kit[/bold cyan]",
-        border_style="cyan"
-    ))
-
-    if local or not global_install:
-        # Install to current project
-        success = install_to_project(
-            project_dir=Path.cwd(),
-            include_examples=with_examples,
-            force=force
-        )
-        if success:
-            console.print("✅ [green]Installation completed successfully![/green]")
-            console.print("\n💡 [yellow]Next steps:[/yellow]")
-            console.print("  1. Run: [cyan]aidk spec create 'Your Feature Name'[/cyan]")
-            console.print("  2. Open your project in Claude Code")
-            console.print("  3. All 36 Android skills are now available!")
+def _register_install(group):
+    """Register the `install` command on *group*."""
+    @group.command()
+    @click.option('--local', is_flag=True, help='Install to current project (.claude/ directory)')
+    @click.option('--global', 'global_install', is_flag=True, help='Install globally (default)')
+    @click.option('--with-examples', is_flag=True, help='Include example SPECs and generated code')
+    @click.option('--force', is_flag=True, help='Overwrite existing files')
+    def install(local, global_install, with_examples, force):
+        """Install AIDK skills and tools to a Claude Code project."""
+        console = _console()
+        _header('install')
+
+        if local or not global_install:
+            # Install to current project
+            from aidk.installer import install_to_project
+
+            success = install_to_project(
+                project_dir=Path.cwd(),
+                include_examples=with_examples,
+                force=force
+            )
+            if success:
+                console.print(_styled('install_done'))
+            else:
+                console.print("❌ [red]Installation failed. See errors above.[/red]")
+                sys.exit(1)
         else:
-            console.print("❌ [red]Installation failed. See errors above.[/red]")
-            sys.exit(1)
-    else:
-        # Global installation
-        console.print("ℹ️  AIDK is already installed globally via pip.")
-        console.print("\n💡 To install skills to a project, run:")
-        console.print("  [cyan]cd your-android-project[/cyan]")
-        console.print("  [cyan]aidk install --local[/cyan]")
-
-
-@cli.command()
-@click.option('--check-only', is_flag=True, help='Only check for updates, do not install')
-def update(check_only):
-    """Check for and install updates."""
-    console.print(Panel.fit(
-        "🔄 [bold cyan]Checking for Updates[/bold cyan]",
-        border_style="cyan"
-    ))
-
-    latest_version = check_for_updates(silent=False)
-
-    if latest_version and latest_version != __version__:
-        console.print(f"\n✨ New version available: [green]{latest_version}[/green]")
-        console.print(f"   Current version: [yellow]{__version__}[/yellow]")
-
-        if not check_only:
-            if click.confirm("\nDo you want to update now?", default=True):
-                perform_update()
+            # Global installation
+            console.print(_styled('install_global'))
+
+    return install
+
+
+def _register_update(group):
+    """Register the `update` command on *group*."""
+    @group.command()
+    @click.option('--check-only', is_flag=True, help='Only check for updates, do not install')
+    def update(check_only):
+        """Check for and install updates."""
+        from aidk.updater import check_for_updates, perform_update
+
+        console = _console()
+        _header('update')
+
+        latest_version = check_for_updates(silent=False)
+
+        if latest_version and latest_version != __version__:
+            console.print(f"\n✨ New version available: [green]{latest_version}[/green]")
+            console.print(f"   Current version: [yellow]{__version__}[/yellow]")
+
+            if not check_only:
+                if click.confirm("\nDo you want to update now?", default=True):
+                    perform_update()
+            else:
+                console.print("\n💡 To update, run: [cyan]aidk update[/cyan]")
         else:
-            console.print("\n💡 To update, run: [cyan]aidk update[/cyan]")
-    else:
-        console.print(f"✅ You're using the latest version: [green]{__version__}[/green]")
+            console.print(f"✅ You're using the latest version: [green]{__version__}[/green]")
 
+    return update
 
-@cli.command()
-def version():
-    """Show version information and check for updates."""
-    console.print(Panel.fit(
-        f"[bold cyan]Android AI Development Kit[/bold cyan]\n"
-        f"Version: [green]{__version__}[/green]",
-        border_style="cyan"
-    ))
 
-    # Check for updates
-    latest_version = check_for_updates(silent=False)
+def _register_version(group):
+    """Register the `version` command on *group*."""
+    @group.command()
+    def version():
+        """Show version information and check for updates."""
+        from aidk.updater import check_for_updates
 
-    if latest_version and latest_version != __version__:
-        console.print(f"\n⚠️  New version available: [yellow]{latest_version}[/yellow]")
-        console.print("   Run [cyan]aidk update[/cyan] to upgrade")
-    else:
-        console.print("\n✅ You're up to date!")
+        console = _console()
+        _header('version')
 
+        # Check for updates
+        latest_version = check_for_updates(silent=False)
 
-@cli.command(name='skills')
-def list_skills_cmd():
-    """List all available Android skills."""
-    console.print(Panel.fit(
-        "📚 [bold cyan]Available Android Skills[/bold cyan]",
-        border_style="cyan"
-    ))
+        if latest_version and latest_version != __version__:
+            console.print(f"\n⚠️  New version available: [yellow]{latest_version}[/yellow]")
+            console.print("   Run [cyan]aidk update[/cyan] to upgrade")
+        else:
+            console.print("\n✅ You're up to date!", markup=False)
 
-    skills = list_skills()
+    return version
 
-    if not skills:
-        console.print("❌ [red]No skills found. Try reinstalling AIDK.[/red]")
-        sys.exit(1)
 
-    # Group skills by category
-    categories = {}
-    for skill in skills:
-        category = skill.get('category', 'Other')
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(skill)
+def _register_skills(group):
+    """Register the `skills` command on *group*."""
+    @group.command(name='skills')
+    def list_skills_cmd():
+        """List all available Android skills."""
+        from rich.table import Table
+        from itertools import groupby
+        from operator import attrgetter
+        from aidk.installer import list_skills
 
-    # Display skills by category
-    for category, skills_list in sorted(categories.items()):
-        table = Table(title=f"\n{category}", show_header=True, header_style="bold magenta")
-        table.add_column("Skill", style="cyan", width=30)
-        table.add_column("Description", style="white", width=60)
+        console = _console()
+        _header('skills')
 
-        for skill in sorted(skills_list, key=lambda x: x['name']):
-            table.add_row(skill['name'], skill['description'])
+        skills = list(list_skills())
 
-        console.print(table)
+        if not skills:
+            console.print("❌ [red]No skills found. Try reinstalling AIDK.[/red]")
+            sys.exit(1)
 
-    console.print(f"\n📊 Total: [green]{len(skills)}[/green] skills available")
+        # Sort once by (category, name), then display one table per category
+        skills.sort(key=attrgetter('category', 'name'))
+        for category, skills_list in groupby(skills, key=attrgetter('category')):
+            if not _IS_TTY:
+                print(f"\n{category}")
+                print('\n'.join(f"{skill.name}\t{skill.description}" for skill in skills_list))
+                continue
 
+            table = Table(title=f"\n{category}", show_header=True, header_style="bold magenta")
+            table.add_column("Skill", style="cyan", width=30)
+            table.add_column("Description", style="white", width=60)
 
-@cli.group()
-def spec():
-    """SPEC document management commands."""
-    pass
+            for skill in skills_list:
+                table.add_row(skill.name, skill.description)
 
+            console.print(table)
 
-@spec.command(name='create')
-@click.argument('feature_name')
-@click.option('--interactive', '-i', is_flag=True, help='Use interactive mode')
-@click.option('--purpose', '-p', help='Feature purpose')
-@click.option('--requirements', '-r', multiple=True, help='Requirements (can be specified multiple times)')
-def spec_create(feature_name, interactive, purpose, requirements):
-    """Create a new SPEC document."""
-    from aidk.spec_builder import main as spec_builder_main
+        console.print(f"\n📊 Total: [green]{len(skills)}[/green] skills available")
 
-    console.print(Panel.fit(
-        f"📝 [bold cyan]Creating SPEC: {feature_name}[/bold cyan]",
-        border_style="cyan"
-    ))
+    return list_skills_cmd
 
-    # Build arguments for spec_builder
-    args = ['create', feature_name]
 
-    if interactive:
-        args = ['interactive']
-    else:
-        if purpose:
-            args.extend(['--purpose', purpose])
-        for req in requirements:
-            args.extend(['--requirements', req])
+def _register_spec(group):
+    """Register the `spec` group on *group*."""
+    @group.group(cls=_LazyGroup)
+    def spec():
+        """SPEC document management commands."""
+        pass
 
-    # Call spec_builder
-    sys.argv = ['spec_builder.py'] + args
-    spec_builder_main()
+    return spec
 
 
-@spec.command(name='validate')
-@click.argument('spec_file', type=click.Path(exists=True))
-def spec_validate(spec_file):
-    """Validate a SPEC document."""
-    from aidk.validate_specs import main as validate_main
+def _register_spec_create(group):
+    """Register the `spec create` command on *group*."""
+    @group.command(name='create')
+    @click.argument('feature_name')
+    @click.option('--interactive', '-i', is_flag=True, help='Use interactive mode')
+    @click.option('--purpose', '-p', help='Feature purpose')
+    @click.option('--requirements', '-r', multiple=True, help='Requirements (can be specified multiple times)')
+    def spec_create(feature_name, interactive, purpose, requirements):
+        """Create a new SPEC document."""
+        _banner(f"📝 [bold cyan]Creating SPEC: {feature_name}[/bold cyan]")
 
-    console.print(Panel.fit(
-        f"✅ [bold cyan]Validating SPEC: {spec_file}[/bold cyan]",
-        border_style="cyan"
-    ))
+        if interactive:
+            exit_code = _cached_import('aidk.spec_builder', 'interactive')()
+        else:
+            create = _cached_import('aidk.spec_builder', 'create')
+            exit_code = create(feature_name, purpose=purpose, requirements=requirements)
 
-    # Call validate_specs
-    sys.argv = ['validate_specs.py', spec_file]
-    validate_main()
+        if exit_code:
+            sys.exit(exit_code)
 
+    return spec_create
 
-@cli.group()
-def code():
-    """Code generation commands."""
-    pass
 
+def _register_spec_validate(group):
+    """Register the `spec validate` command on *group*."""
+    @group.command(name='validate')
+    @click.argument('spec_file', type=click.Path())
+    def spec_validate(spec_file):
+        """Validate a SPEC document."""
+        _require_file(spec_file)
 
-@code.command(name='generate')
-@click.argument('spec_file', type=click.Path(exists=True))
-@click.option('--output', '-o', default='./src', help='Output directory for generated code')
-@click.option('--package', '-p', default='com.example.app', help='Android package name')
-def code_generate(spec_file, output, package):
-    """Generate code from a SPEC document."""
-    from aidk.code_builder import main as code_builder_main
+        validate = _cached_import('aidk.validate_specs', 'validate')
 
-    console.print(Panel.fit(
-        f"⚙️  [bold cyan]Generating code from: {spec_file}[/bold cyan]",
-        border_style="cyan"
-    ))
+        _banner(f"✅ [bold cyan]Validating SPEC: {spec_file}[/bold cyan]")
 
-    # Call code_builder
-    sys.argv = ['code_builder.py', 'generate', spec_file, '--output', output, '--package', package]
-    code_builder_main()
+        sys.exit(validate([Path(spec_file)]))
 
-    console.print(f"\n✅ [green]Code generated successfully in: {output}[/green]")
+    return spec_validate
 
 
-@cli.group()
-def docs():
-    """Documentation management commands."""
-    pass
+def _register_code(group):
+    """Register the `code` group on *group*."""
+    @group.group(cls=_LazyGroup)
+    def code():
+        """Code generation commands."""
+        pass
 
+    return code
 
-@docs.command(name='sync')
-@click.argument('spec_file', type=click.Path(exists=True))
-@click.option('--code', '-c', default='./src', help='Code directory to analyze')
-def docs_sync(spec_file, code):
-    """Synchronize documentation with SPEC and code."""
-    from aidk.doc_syncer import main as doc_syncer_main
 
-    console.print(Panel.fit(
-        f"🔄 [bold cyan]Syncing docs for: {spec_file}[/bold cyan]",
-        border_style="cyan"
-    ))
+def _register_code_generate(group):
+    """Register the `code generate` command on *group*."""
+    @group.command(name='generate')
+    @click.argument('spec_file', type=click.Path())
+    @click.option('--output', '-o', default='./src', help='Output directory for generated code')
+    @click.option('--package', '-p', default='com.example.app', help='Android package name')
+    @click.option('--quiet', '-q', is_flag=True, help='Suppress progress output')
+    def code_generate(spec_file, output, package, quiet):
+        """Generate code from a SPEC document."""
+        _require_file(spec_file)
 
-    # Call doc_syncer
-    sys.argv = ['doc_syncer.py', 'sync', spec_file, '--code', code]
-    doc_syncer_main()
+        generate = _cached_import('aidk.code_builder', 'generate')
 
-    console.print("\n✅ [green]Documentation synchronized successfully![/green]")
+        if not quiet:
+            _banner(f"⚙️  [bold cyan]Generating code from: {spec_file}[/bold cyan]")
 
+        exit_code = generate(Path(spec_file), Path(output), package, quiet=quiet)
+        if exit_code:
+            sys.exit(exit_code)
 
-@docs.command(name='verify')
-@click.argument('spec_file', type=click.Path(exists=True))
-@click.option('--code', '-c', default='./src', help='Code directory to analyze')
-def docs_verify(spec_file, code):
-    """Verify SPEC-code alignment."""
-    from aidk.doc_syncer import main as doc_syncer_main
+        if not quiet:
+            _console().print(f"\n✅ [green]Code generated successfully in: {output}[/green]")
 
-    console.print(Panel.fit(
-        f"🔍 [bold cyan]Verifying alignment: {spec_file}[/bold cyan]",
-        border_style="cyan"
-    ))
+    return code_generate
 
-    # Call doc_syncer
-    sys.argv = ['doc_syncer.py', 'verify', spec_file, '--code', code]
-    doc_syncer_main()
 
+def _register_docs(group):
+    """Register the `docs` group on *group*."""
+    @group.group(cls=_LazyGroup)
+    def docs():
+        """Documentation management commands."""
+        pass
+
+    return docs
+
+
+def _register_docs_sync(group):
+    """Register the `docs sync` command on *group*."""
+    @group.command(name='sync')
+    @click.argument('spec_file', type=click.Path())
+    @click.option('--code', '-c', default='./src', help='Code directory to analyze')
+    def docs_sync(spec_file, code):
+        """Synchronize documentation with SPEC and code."""
+        _require_file(spec_file)
+
+        sync = _cached_import('aidk.doc_syncer', 'sync')
+
+        console = _console()
+        _banner(f"🔄 [bold cyan]Syncing docs for: {spec_file}[/bold cyan]")
+
+        exit_code = sync(Path(spec_file), Path(code))
+        if exit_code:
+            sys.exit(exit_code)
+
+        console.print("\n✅ [green]Documentation synchronized successfully![/green]")
+
+    return docs_sync
 
-@cli.command()
-def info():
-    """Display AIDK information and system status."""
-    console.print(Panel.fit(
-        "[bold cyan]Android AI Development Kit (AIDK)[/bold cyan]\n"
-        f"Version: [green]{__version__}[/green]",
-        border_style="cyan"
-    ))
-
-    # System information
-    table = Table(show_header=False, box=None)
-    table.add_column("Key", style="cyan")
-    table.add_column("Value", style="white")
-
-    table.add_row("Python Version", f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-    table.add_row("Platform", sys.platform)
-
-    # Check if in a Claude Code project
-    claude_dir = Path.cwd() / ".claude"
-    if claude_dir.exists():
-        table.add_row("Claude Code Project", "✅ Yes")
-        skills_dir = claude_dir / "skills"
-        if skills_dir.exists():
-            skill_count = len(list(skills_dir.glob("*")))
-            table.add_row("Installed Skills", f"{skill_count}")
-    else:
-        table.add_row("Claude Code Project", "❌ No")
 
-    console.print("\n")
-    console.print(table)
+def _register_docs_verify(group):
+    """Register the `docs verify` command on *group*."""
+    @group.command(name='verify')
+    @click.argument('spec_file', type=click.Path())
+    @click.option('--code', '-c', default='./src', help='Code directory to analyze')
+    def docs_verify(spec_file, code):
+        """Verify SPEC-code alignment."""
+        _require_file(spec_file)
 
-    console.print("\n💡 [yellow]Quick Start:[/yellow]")
-    console.print("  [cyan]aidk install --local[/cyan]        # Install skills to current project")
-    console.print("  [cyan]aidk spec create 'Feature'[/cyan]  # Create a new SPEC")
-    console.print("  [cyan]aidk skills[/cyan]                 # List all available skills")
+        verify = _cached_import('aidk.doc_syncer', 'verify')
+
+        _banner(f"🔍 [bold cyan]Verifying alignment: {spec_file}[/bold cyan]")
+
+        exit_code = verify(Path(spec_file), Path(code))
+        if exit_code:
+            sys.exit(exit_code)
+
+    return docs_verify
+
+
+def _register_info(group):
+    """Register the `info` command on *group*."""
+    @group.command()
+    def info():
+        """Display AIDK information and system status."""
+        console = _console()
+        _header('info')
+
+        # System information
+        rows = [
+            ("Python Version", f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"),
+            ("Platform", sys.platform),
+        ]
+
+        # Check if in a Claude Code project
+        claude_dir = Path.cwd() / ".claude"
+        if claude_dir.exists():
+            rows.append(("Claude Code Project", "✅ Yes"))
+            skills_dir = claude_dir / "skills"
+            if skills_dir.exists():
+                from aidk.installer import count_skills
+
+                rows.append(("Installed Skills", f"{count_skills(skills_dir)}"))
+        else:
+            rows.append(("Claude Code Project", "❌ No"))
+
+        if _IS_TTY:
+            from rich.table import Table
+
+            table = Table(show_header=False, box=None)
+            table.add_column("Key", style="cyan")
+            table.add_column("Value", style="white")
+            for key, value in rows:
+                table.add_row(key, value)
+
+            console.print("\n", markup=False)
+            console.print(table)
+        else:
+            print()
+            print('\n'.join(f"{key}\t{value}" for key, value in rows))
+
+        console.print(_styled('quick_start'))
+
+    return info
+
+
+# Command name -> (registrar, nested subcommands), see _LazyGroup. Only the
+# command actually invoked (or listed by --help) is ever built.
+_COMMANDS = {
+    'install': (_register_install, None),
+    'update': (_register_update, None),
+    'version': (_register_version, None),
+    'skills': (_register_skills, None),
+    'spec': (_register_spec, {
+        'create': (_register_spec_create, None),
+        'validate': (_register_spec_validate, None),
+    }),
+    'code': (_register_code, {
+        'generate': (_register_code_generate, None),
+    }),
+    'docs': (_register_docs, {
+        'sync': (_register_docs_sync, None),
+        'verify': (_register_docs_verify, None),
+    }),
+    'info': (_register_info, None),
+}
+
+cli.lazy_commands = _COMMANDS
 
 
 def main():
@@ -321,10 +520,15 @@ def main():
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n\n⚠️  [yellow]Operation cancelled by user[/yellow]")
+        sys.stderr.write("\n\n⚠️  Operation cancelled by user\n")
         sys.exit(130)
     except Exception as e:
-        console.print(f"\n❌ [red]Error: {str(e)}[/red]")
+        # Rich is only imported here, so successful runs never pay for it
+        try:
+            from rich.console import Console
+            Console(stderr=True).print(f"\n❌ [red]Error: {e}[/red]")
+        except Exception:
+            sys.stderr.write(f"\nError: {e}\n")
         sys.exit(1)
 
 
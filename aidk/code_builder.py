@@ -10,12 +10,15 @@ Usage:
     python code_builder.py generate specs/examples/user-authentication/SPEC.md --output ./output
 """
 
-import argparse
+import mmap
+import os
 import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 # ANSI color codes
 class Colors:
@@ -29,9 +32,30 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Plain output when piped or when NO_COLOR is set
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR') is not None:
+    for _name in [n for n in vars(Colors) if n.isupper()]:
+        setattr(Colors, _name, '')
+
+
+# Patterns used by SpecParser, compiled once at import. Body patterns are
+# bytes patterns so they can run directly over the memory-mapped file.
+_PURPOSE_RE = re.compile(rb'\*\*Purpose\*\*: (.+)')
+# Requirement patterns capture (id, [type,] description) with the trailing
+# whitespace already trimmed, so findall tuples can be used as-is
+_REQ_RE = re.compile(
+    rb'-\s+\*\*([A-Z]+-\d+-([USEON])-\d+)\*\*:\s+([^\n]+?)[ \t\r]*(?=\n|\Z)'
+)
+# Fallback for IDs that don't follow the REQ-XXX-Y-ZZ shape
+_LOOSE_REQ_RE = re.compile(rb'-\s+\*\*([A-Z-]+)\*\*:\s+([^\n]+?)[ \t\r]*(?=\n|\Z)')
+_REQ_TYPE_RE = re.compile(r'-([USEON])-')
+
+
 @dataclass
 class Requirement:
     """Represents a single requirement."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("id", "type", "description")
     id: str
     type: str  # U, S, E, O, N
     description: str
@@ -40,6 +64,10 @@ class Requirement:
 @dataclass
 class SpecDocument:
     """Parsed SPEC document."""
+    __slots__ = (
+        "spec_id", "feature", "status", "version", "author", "date",
+        "related_skills", "requirements", "purpose",
+    )
     spec_id: str
     feature: str
     status: str
@@ -64,318 +92,211 @@ class SpecParser:
         Returns:
             Parsed SpecDocument
         """
-        with open(spec_file, 'r') as f:
-            content = f.read()
-
-        # Parse frontmatter
-        frontmatter_match = re.search(r'---\n(.*?)\n---', content, re.DOTALL)
-        if not frontmatter_match:
-            raise ValueError("No frontmatter found in SPEC file")
-
-        frontmatter = frontmatter_match.group(1)
-
-        # Extract metadata
-        spec_id = SpecParser._extract_field(frontmatter, 'spec_id')
-        feature = SpecParser._extract_field(frontmatter, 'feature')
-        status = SpecParser._extract_field(frontmatter, 'status', 'draft')
-        version = SpecParser._extract_field(frontmatter, 'version', '1.0.0')
-        author = SpecParser._extract_field(frontmatter, 'author', 'Unknown')
-        date = SpecParser._extract_field(frontmatter, 'date', '')
-
-        # Extract related skills
-        skills_match = re.search(r'related_skills:\n((?:  - .*\n)*)', frontmatter)
-        related_skills = []
-        if skills_match:
-            skills_text = skills_match.group(1)
-            related_skills = [
-                line.strip().replace('- ', '')
-                for line in skills_text.split('\n')
-                if line.strip().startswith('-')
-            ]
-
-        # Extract purpose
-        purpose_match = re.search(r'\*\*Purpose\*\*: (.+)', content)
-        purpose = purpose_match.group(1) if purpose_match else ""
-
-        # Extract requirements
-        requirements = SpecParser._extract_requirements(content)
+        with open(spec_file, 'rb') as f:
+            try:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                raise ValueError("No frontmatter found in SPEC file") from None
+
+        # Scan the mapping in place; only matched pieces are decoded
+        with content:
+            # Locate frontmatter between the first two --- delimiters
+            start, width = content.find(b'---\n'), 4
+            if start == -1:
+                start, width = content.find(b'---\r\n'), 5
+            end = content.find(b'\n---', start + width) if start != -1 else -1
+            if end == -1:
+                raise ValueError("No frontmatter found in SPEC file")
+
+            fields, related_skills = SpecParser._parse_frontmatter(
+                content[start + width:end].decode('utf-8')
+            )
+
+            # Body patterns start scanning after the closing delimiter
+            body_start = end + 4
+
+            # Extract purpose
+            purpose_match = _PURPOSE_RE.search(content, body_start)
+            purpose = purpose_match.group(1).decode('utf-8').rstrip('\r') if purpose_match else ""
+
+            # Extract requirements
+            requirements = SpecParser._extract_requirements(content, body_start)
 
         return SpecDocument(
-            spec_id=spec_id,
-            feature=feature,
-            status=status,
-            version=version,
-            author=author,
-            date=date,
+            spec_id=fields.get('spec_id', ''),
+            feature=fields.get('feature', ''),
+            status=fields.get('status', 'draft'),
+            version=fields.get('version', '1.0.0'),
+            author=fields.get('author', 'Unknown'),
+            date=fields.get('date', ''),
             related_skills=related_skills,
             requirements=requirements,
             purpose=purpose
         )
 
     @staticmethod
-    def _extract_field(text: str, field: str, default: str = '') -> str:
-        """Extract a field from frontmatter."""
-        match = re.search(rf'{field}:\s*(.+)', text)
-        return match.group(1).strip() if match else default
+    def _parse_frontmatter(frontmatter: str) -> Tuple[Dict[str, str], List[str]]:
+        """Parse frontmatter lines in a single pass.
 
-    @staticmethod
-    def _extract_requirements(content: str) -> List[Requirement]:
-        """Extract requirements from SPEC content."""
-        requirements = []
+        Args:
+            frontmatter: Text between the --- delimiters
 
-        # Pattern: - **REQ-XXX-Y-ZZ**: Description
-        pattern = r'-\s+\*\*([A-Z-]+)\*\*:\s+(.+)'
-        matches = re.finditer(pattern, content)
+        Returns:
+            Tuple of (`key: value` fields, related_skills entries)
+        """
+        fields: Dict[str, str] = {}
+        related_skills = []
+        in_skills = False
+        for line in frontmatter.splitlines():
+            if in_skills and line.startswith('  - '):
+                related_skills.append(line[4:].strip())
+                continue
+            in_skills = line.rstrip() == 'related_skills:'
+            key, sep, value = line.partition(':')
+            if sep:
+                fields.setdefault(key.strip(), value.strip())
+        return fields, related_skills
 
-        for match in matches:
-            req_id = match.group(1)
-            description = match.group(2).strip()
+    @staticmethod
+    def _extract_requirements(content: bytes, pos: int = 0) -> List[Requirement]:
+        """Extract requirements from raw SPEC content, scanning from `pos`."""
+        # Pattern: - **REQ-XXX-Y-ZZ**: Description (type letter captured directly)
+        requirements = [
+            Requirement(
+                id=req_id.decode('ascii'),
+                type=req_type.decode('ascii'),
+                description=description.decode('utf-8')
+            )
+            for req_id, req_type, description in _REQ_RE.findall(content, pos)
+        ]
+        if requirements:
+            return requirements
+
+        for raw_id, description in _LOOSE_REQ_RE.findall(content, pos):
+            req_id = raw_id.decode('ascii')
 
             # Determine type from ID (REQ-001-U-01 -> U)
-            type_match = re.search(r'-([USEON])-', req_id)
+            type_match = _REQ_TYPE_RE.search(req_id)
             req_type = type_match.group(1) if type_match else 'U'
 
             requirements.append(Requirement(
                 id=req_id,
                 type=req_type,
-                description=description
+                description=description.decode('utf-8')
             ))
 
         return requirements
 
 
-class CodeGenerator:
-    """Generates Android code from SPEC."""
-
-    def __init__(self, spec: SpecDocument, output_dir: Path):
-        """Initialize code generator.
-
-        Args:
-            spec: Parsed SPEC document
-            output_dir: Output directory for generated code
-        """
-        self.spec = spec
-        self.output_dir = output_dir
-        self.package_name = "com.example.app"  # Default package
-        self.feature_name = spec.feature.replace(" ", "").replace("-", "")
-
-    def generate_all(self):
-        """Generate all code layers."""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}=== Code Builder ==={Colors.ENDC}\n")
-        print(f"{Colors.OKBLUE}Generating code for: {self.spec.feature} (SPEC-{self.spec.spec_id}){Colors.ENDC}")
-        print(f"{Colors.OKBLUE}Related Skills: {len(self.spec.related_skills)}{Colors.ENDC}\n")
-
-        self._create_directory_structure()
-        self.generate_domain_layer()
-        self.generate_data_layer()
-        self.generate_presentation_layer()
-        self.generate_tests()
+class FieldSpec(NamedTuple):
+    """A property shared by the generated domain model, DTO and mapper."""
+    name: str
+    kotlin_type: str
+    dto_annotation: str = ''
 
-        print(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ Code generation complete!{Colors.ENDC}")
-        print(f"{Colors.OKBLUE}Output: {self.output_dir}{Colors.ENDC}")
 
-    def _create_directory_structure(self):
-        """Create Clean Architecture directory structure."""
-        base_path = self.output_dir / "src" / "main" / "kotlin" / self.package_name.replace(".", "/")
-        test_path = self.output_dir / "src" / "test" / "kotlin" / self.package_name.replace(".", "/")
-
-        # Main source directories
-        (base_path / "domain" / "model").mkdir(parents=True, exist_ok=True)
-        (base_path / "domain" / "usecase").mkdir(parents=True, exist_ok=True)
-        (base_path / "domain" / "repository").mkdir(parents=True, exist_ok=True)
-
-        (base_path / "data" / "remote").mkdir(parents=True, exist_ok=True)
-        (base_path / "data" / "local").mkdir(parents=True, exist_ok=True)
-        (base_path / "data" / "repository").mkdir(parents=True, exist_ok=True)
-
-        (base_path / "presentation" / "viewmodel").mkdir(parents=True, exist_ok=True)
-        (base_path / "presentation" / "ui").mkdir(parents=True, exist_ok=True)
-        (base_path / "presentation" / "state").mkdir(parents=True, exist_ok=True)
-
-        # Test directories
-        (test_path / "domain").mkdir(parents=True, exist_ok=True)
-        (test_path / "data").mkdir(parents=True, exist_ok=True)
-        (test_path / "presentation").mkdir(parents=True, exist_ok=True)
-
-    def generate_domain_layer(self):
-        """Generate domain layer code."""
-        print(f"{Colors.OKCYAN}Generating Domain Layer...{Colors.ENDC}")
-
-        # Generate model
-        model_code = self._generate_domain_model()
-        self._write_file("domain/model", f"{self.feature_name}.kt", model_code)
-
-        # Generate repository interface
-        repo_interface = self._generate_repository_interface()
-        self._write_file("domain/repository", f"{self.feature_name}Repository.kt", repo_interface)
-
-        # Generate use cases
-        usecases = self._generate_usecases()
-        for usecase_name, usecase_code in usecases:
-            self._write_file("domain/usecase", f"{usecase_name}.kt", usecase_code)
-
-        print(f"  {Colors.OKGREEN}✓ Domain layer complete{Colors.ENDC}")
-
-    def generate_data_layer(self):
-        """Generate data layer code."""
-        print(f"{Colors.OKCYAN}Generating Data Layer...{Colors.ENDC}")
-
-        # Generate API interface
-        api_code = self._generate_api_interface()
-        self._write_file("data/remote", f"{self.feature_name}Api.kt", api_code)
-
-        # Generate DTOs
-        dto_code = self._generate_dtos()
-        self._write_file("data/remote", f"{self.feature_name}Dto.kt", dto_code)
-
-        # Generate repository implementation
-        repo_impl = self._generate_repository_implementation()
-        self._write_file("data/repository", f"{self.feature_name}RepositoryImpl.kt", repo_impl)
-
-        print(f"  {Colors.OKGREEN}✓ Data layer complete{Colors.ENDC}")
-
-    def generate_presentation_layer(self):
-        """Generate presentation layer code."""
-        print(f"{Colors.OKCYAN}Generating Presentation Layer...{Colors.ENDC}")
-
-        # Generate state
-        state_code = self._generate_state()
-        self._write_file("presentation/state", f"{self.feature_name}State.kt", state_code)
-
-        # Generate ViewModel
-        viewmodel_code = self._generate_viewmodel()
-        self._write_file("presentation/viewmodel", f"{self.feature_name}ViewModel.kt", viewmodel_code)
-
-        # Generate Screen
-        screen_code = self._generate_screen()
-        self._write_file("presentation/ui", f"{self.feature_name}Screen.kt", screen_code)
-
-        print(f"  {Colors.OKGREEN}✓ Presentation layer complete{Colors.ENDC}")
-
-    def generate_tests(self):
-        """Generate test files."""
-        print(f"{Colors.OKCYAN}Generating Tests...{Colors.ENDC}")
+# Leaf directories of the generated source trees
+_MAIN_DIRS = (
+    "domain/model", "domain/usecase", "domain/repository",
+    "data/remote", "data/local", "data/repository",
+    "presentation/viewmodel", "presentation/ui", "presentation/state",
+)
+_TEST_DIRS = ("domain", "data", "presentation")
 
-        # Generate unit tests
-        test_code = self._generate_unit_tests()
-        test_path = self.output_dir / "src" / "test" / "kotlin" / self.package_name.replace(".", "/") / "domain"
-        test_file = test_path / f"{self.feature_name}UseCaseTest.kt"
-        test_file.parent.mkdir(parents=True, exist_ok=True)
-        test_file.write_text(test_code)
 
-        print(f"  {Colors.OKGREEN}✓ Tests complete{Colors.ENDC}")
+# Properties every generated model starts with
+_BASE_FIELDS = (FieldSpec('id', 'String'),)
 
-    def _write_file(self, subdir: str, filename: str, content: str):
-        """Write generated code to file."""
-        base_path = self.output_dir / "src" / "main" / "kotlin" / self.package_name.replace(".", "/")
-        file_path = base_path / subdir / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content)
 
-    def _generate_domain_model(self) -> str:
-        """Generate domain model."""
-        return f"""package {self.package_name}.domain.model
+# Kotlin source templates; {name} fields are filled from CodeGenerator._ctx
+_TEMPLATES: Dict[str, str] = {
+    'domain_model': """package {package}.domain.model
 
-// {self.spec.spec_id}: {self.spec.feature}
-// Purpose: {self.spec.purpose}
-data class {self.feature_name}(
-    val id: String,
+// {spec_id}: {spec_feature}
+// Purpose: {purpose}
+data class {feature}(
+    {model_fields}
     // TODO: Add properties based on SPEC requirements
 )
-"""
+""",
 
-    def _generate_repository_interface(self) -> str:
-        """Generate repository interface."""
-        return f"""package {self.package_name}.domain.repository
+    'repository_interface': """package {package}.domain.repository
 
-import {self.package_name}.domain.model.{self.feature_name}
+import {package}.domain.model.{feature}
 
-// {self.spec.spec_id}: Repository interface
-interface {self.feature_name}Repository {{
-    suspend fun get{self.feature_name}(id: String): Result<{self.feature_name}>
+// {spec_id}: Repository interface
+interface {feature}Repository {{
+    suspend fun get{feature}(id: String): Result<{feature}>
     // TODO: Add methods based on SPEC requirements
 }}
-"""
-
-    def _generate_usecases(self) -> List[Tuple[str, str]]:
-        """Generate use cases."""
-        usecases = []
+""",
 
-        usecase_name = f"Get{self.feature_name}UseCase"
-        usecase_code = f"""package {self.package_name}.domain.usecase
+    'usecase': """package {package}.domain.usecase
 
-import {self.package_name}.domain.model.{self.feature_name}
-import {self.package_name}.domain.repository.{self.feature_name}Repository
+import {package}.domain.model.{feature}
+import {package}.domain.repository.{feature}Repository
 import javax.inject.Inject
 
-// {self.spec.spec_id}: Get {self.feature_name} use case
-class {usecase_name} @Inject constructor(
-    private val repository: {self.feature_name}Repository
+// {spec_id}: Get {feature} use case
+class Get{feature}UseCase @Inject constructor(
+    private val repository: {feature}Repository
 ) {{
-    suspend operator fun invoke(id: String): Result<{self.feature_name}> {{
-        return repository.get{self.feature_name}(id)
+    suspend operator fun invoke(id: String): Result<{feature}> {{
+        return repository.get{feature}(id)
     }}
 }}
-"""
-        usecases.append((usecase_name, usecase_code))
+""",
 
-        return usecases
+    'api_interface': """package {package}.data.remote
 
-    def _generate_api_interface(self) -> str:
-        """Generate API interface."""
-        return f"""package {self.package_name}.data.remote
-
-import {self.package_name}.data.remote.{self.feature_name}Dto
+import {package}.data.remote.{feature}Dto
 import retrofit2.Response
 import retrofit2.http.GET
 import retrofit2.http.Path
 
-// {self.spec.spec_id}: API interface
-interface {self.feature_name}Api {{
-    @GET("api/{self.feature_name.lower()}/{{id}}")
-    suspend fun get{self.feature_name}(@Path("id") id: String): Response<{self.feature_name}Dto>
+// {spec_id}: API interface
+interface {feature}Api {{
+    @GET("api/{feature_lower}/{{id}}")
+    suspend fun get{feature}(@Path("id") id: String): Response<{feature}Dto>
 }}
-"""
+""",
 
-    def _generate_dtos(self) -> str:
-        """Generate DTOs."""
-        return f"""package {self.package_name}.data.remote
+    'dto': """package {package}.data.remote
 
-import {self.package_name}.domain.model.{self.feature_name}
+import {package}.domain.model.{feature}
 import kotlinx.serialization.Serializable
 
-// {self.spec.spec_id}: Data transfer object
+// {spec_id}: Data transfer object
 @Serializable
-data class {self.feature_name}Dto(
-    val id: String,
+data class {feature}Dto(
+    {dto_fields}
     // TODO: Add fields based on SPEC
 )
 
-// {self.spec.spec_id}: Mapper from DTO to Domain
-fun {self.feature_name}Dto.toDomain(): {self.feature_name} = {self.feature_name}(
-    id = id,
+// {spec_id}: Mapper from DTO to Domain
+fun {feature}Dto.toDomain(): {feature} = {feature}(
+    {mapper_fields}
     // TODO: Map fields
 )
-"""
+""",
 
-    def _generate_repository_implementation(self) -> str:
-        """Generate repository implementation."""
-        return f"""package {self.package_name}.data.repository
+    'repository_implementation': """package {package}.data.repository
 
-import {self.package_name}.data.remote.{self.feature_name}Api
-import {self.package_name}.data.remote.toDomain
-import {self.package_name}.domain.model.{self.feature_name}
-import {self.package_name}.domain.repository.{self.feature_name}Repository
+import {package}.data.remote.{feature}Api
+import {package}.data.remote.toDomain
+import {package}.domain.model.{feature}
+import {package}.domain.repository.{feature}Repository
 import javax.inject.Inject
 
-// {self.spec.spec_id}: Repository implementation
-class {self.feature_name}RepositoryImpl @Inject constructor(
-    private val api: {self.feature_name}Api,
-) : {self.feature_name}Repository {{
+// {spec_id}: Repository implementation
+class {feature}RepositoryImpl @Inject constructor(
+    private val api: {feature}Api,
+) : {feature}Repository {{
 
-    override suspend fun get{self.feature_name}(id: String): Result<{self.feature_name}> {{
+    override suspend fun get{feature}(id: String): Result<{feature}> {{
         return try {{
-            val response = api.get{self.feature_name}(id)
+            val response = api.get{feature}(id)
             if (response.isSuccessful) {{
                 response.body()?.let {{
                     Result.success(it.toDomain())
@@ -388,63 +309,59 @@ class {self.feature_name}RepositoryImpl @Inject constructor(
         }}
     }}
 }}
-"""
+""",
 
-    def _generate_state(self) -> str:
-        """Generate state classes."""
-        return f"""package {self.package_name}.presentation.state
+    'state': """package {package}.presentation.state
 
-import {self.package_name}.domain.model.{self.feature_name}
+import {package}.domain.model.{feature}
 
-// {self.spec.spec_id}: Screen state
-data class {self.feature_name}State(
+// {spec_id}: Screen state
+data class {feature}State(
     val isLoading: Boolean = false,
-    val data: {self.feature_name}? = null,
+    val data: {feature}? = null,
     val error: String? = null,
 )
 
-// {self.spec.spec_id}: User actions
-sealed interface {self.feature_name}Action {{
-    data class Load(val id: String) : {self.feature_name}Action
+// {spec_id}: User actions
+sealed interface {feature}Action {{
+    data class Load(val id: String) : {feature}Action
 }}
 
-// {self.spec.spec_id}: One-time events
-sealed interface {self.feature_name}Event {{
-    data class ShowError(val message: String) : {self.feature_name}Event
+// {spec_id}: One-time events
+sealed interface {feature}Event {{
+    data class ShowError(val message: String) : {feature}Event
 }}
-"""
+""",
 
-    def _generate_viewmodel(self) -> str:
-        """Generate ViewModel."""
-        return f"""package {self.package_name}.presentation.viewmodel
+    'viewmodel': """package {package}.presentation.viewmodel
 
 import androidx.lifecycle.ViewModel
 import androidx.lifecycle.viewModelScope
-import {self.package_name}.domain.usecase.Get{self.feature_name}UseCase
-import {self.package_name}.presentation.state.{self.feature_name}Action
-import {self.package_name}.presentation.state.{self.feature_name}Event
-import {self.package_name}.presentation.state.{self.feature_name}State
+import {package}.domain.usecase.Get{feature}UseCase
+import {package}.presentation.state.{feature}Action
+import {package}.presentation.state.{feature}Event
+import {package}.presentation.state.{feature}State
 import dagger.hilt.android.lifecycle.HiltViewModel
 import kotlinx.coroutines.channels.Channel
 import kotlinx.coroutines.flow.*
 import kotlinx.coroutines.launch
 import javax.inject.Inject
 
-// {self.spec.spec_id}: ViewModel
+// {spec_id}: ViewModel
 @HiltViewModel
-class {self.feature_name}ViewModel @Inject constructor(
-    private val get{self.feature_name}UseCase: Get{self.feature_name}UseCase,
+class {feature}ViewModel @Inject constructor(
+    private val get{feature}UseCase: Get{feature}UseCase,
 ) : ViewModel() {{
 
-    private val _state = MutableStateFlow({self.feature_name}State())
-    val state: StateFlow<{self.feature_name}State> = _state.asStateFlow()
+    private val _state = MutableStateFlow({feature}State())
+    val state: StateFlow<{feature}State> = _state.asStateFlow()
 
-    private val _events = Channel<{self.feature_name}Event>()
+    private val _events = Channel<{feature}Event>()
     val events = _events.receiveAsFlow()
 
-    fun onAction(action: {self.feature_name}Action) {{
+    fun onAction(action: {feature}Action) {{
         when (action) {{
-            is {self.feature_name}Action.Load -> load(action.id)
+            is {feature}Action.Load -> load(action.id)
         }}
     }}
 
@@ -452,22 +369,20 @@ class {self.feature_name}ViewModel @Inject constructor(
         viewModelScope.launch {{
             _state.update {{ it.copy(isLoading = true, error = null) }}
 
-            get{self.feature_name}UseCase(id)
+            get{feature}UseCase(id)
                 .onSuccess {{ data ->
                     _state.update {{ it.copy(isLoading = false, data = data) }}
                 }}
                 .onFailure {{ error ->
                     _state.update {{ it.copy(isLoading = false, error = error.message) }}
-                    _events.send({self.feature_name}Event.ShowError(error.message ?: "Unknown error"))
+                    _events.send({feature}Event.ShowError(error.message ?: "Unknown error"))
                 }}
         }}
     }}
 }}
-"""
+""",
 
-    def _generate_screen(self) -> str:
-        """Generate Compose screen."""
-        return f"""package {self.package_name}.presentation.ui
+    'screen': """package {package}.presentation.ui
 
 import androidx.compose.foundation.layout.*
 import androidx.compose.material3.*
@@ -477,37 +392,37 @@ import androidx.compose.ui.Modifier
 import androidx.compose.ui.unit.dp
 import androidx.hilt.navigation.compose.hiltViewModel
 import androidx.lifecycle.compose.collectAsStateWithLifecycle
-import {self.package_name}.presentation.state.{self.feature_name}Action
-import {self.package_name}.presentation.state.{self.feature_name}Event
-import {self.package_name}.presentation.viewmodel.{self.feature_name}ViewModel
+import {package}.presentation.state.{feature}Action
+import {package}.presentation.state.{feature}Event
+import {package}.presentation.viewmodel.{feature}ViewModel
 
-// {self.spec.spec_id}: Screen
+// {spec_id}: Screen
 @Composable
-fun {self.feature_name}Screen(
-    viewModel: {self.feature_name}ViewModel = hiltViewModel(),
+fun {feature}Screen(
+    viewModel: {feature}ViewModel = hiltViewModel(),
 ) {{
     val state by viewModel.state.collectAsStateWithLifecycle()
 
     LaunchedEffect(Unit) {{
         viewModel.events.collect {{ event ->
             when (event) {{
-                is {self.feature_name}Event.ShowError -> {{
+                is {feature}Event.ShowError -> {{
                     // TODO: Show snackbar or toast
                 }}
             }}
         }}
     }}
 
-    {self.feature_name}Content(
+    {feature}Content(
         state = state,
         onAction = viewModel::onAction,
     )
 }}
 
 @Composable
-private fun {self.feature_name}Content(
-    state: {self.spec.feature.replace(" ", "")}State,
-    onAction: ({self.feature_name}Action) -> Unit,
+private fun {feature}Content(
+    state: {spec_feature_compact}State,
+    onAction: ({feature}Action) -> Unit,
 ) {{
     Column(
         modifier = Modifier
@@ -524,15 +439,13 @@ private fun {self.feature_name}Content(
         }}
     }}
 }}
-"""
+""",
 
-    def _generate_unit_tests(self) -> str:
-        """Generate unit tests."""
-        return f"""package {self.package_name}.domain
+    'unit_tests': """package {package}.domain
 
-import {self.package_name}.domain.model.{self.feature_name}
-import {self.package_name}.domain.repository.{self.feature_name}Repository
-import {self.package_name}.domain.usecase.Get{self.feature_name}UseCase
+import {package}.domain.model.{feature}
+import {package}.domain.repository.{feature}Repository
+import {package}.domain.usecase.Get{feature}UseCase
 import kotlinx.coroutines.test.runTest
 import org.junit.Before
 import org.junit.Test
@@ -541,26 +454,26 @@ import org.mockito.Mockito.`when`
 import org.mockito.MockitoAnnotations
 import kotlin.test.assertTrue
 
-// TEST-{self.spec.spec_id}-U-01: Test Get{self.feature_name}UseCase
-class {self.feature_name}UseCaseTest {{
+// TEST-{spec_id}-U-01: Test Get{feature}UseCase
+class {feature}UseCaseTest {{
 
     @Mock
-    private lateinit var repository: {self.feature_name}Repository
+    private lateinit var repository: {feature}Repository
 
-    private lateinit var useCase: Get{self.feature_name}UseCase
+    private lateinit var useCase: Get{feature}UseCase
 
     @Before
     fun setup() {{
         MockitoAnnotations.openMocks(this)
-        useCase = Get{self.feature_name}UseCase(repository)
+        useCase = Get{feature}UseCase(repository)
     }}
 
     @Test
-    fun `get {self.feature_name.lower()} returns success`() = runTest {{
+    fun `get {feature_lower} returns success`() = runTest {{
         // Given
         val id = "test-id"
-        val expected{self.feature_name} = {self.feature_name}(id = id)
-        `when`(repository.get{self.feature_name}(id)).thenReturn(Result.success(expected{self.feature_name}))
+        val expected{feature} = {feature}(id = id)
+        `when`(repository.get{feature}(id)).thenReturn(Result.success(expected{feature}))
 
         // When
         val result = useCase(id)
@@ -569,39 +482,363 @@ class {self.feature_name}UseCaseTest {{
         assertTrue(result.isSuccess)
     }}
 }}
-"""
+""",
+}
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(description="Code Builder - Generate Android code from SPEC")
-    parser.add_argument("command", choices=["generate"], help="Command to execute")
-    parser.add_argument("spec_file", help="Path to SPEC.md file")
-    parser.add_argument("--output", "-o", help="Output directory", default="./generated")
-    parser.add_argument("--package", "-p", help="Package name", default="com.example.app")
+def _split_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a template into (literal, field) pairs.
+
+    Args:
+        template: str.format-style template
+
+    Returns:
+        Tuple of literal text chunks, each followed by a field name or None
+    """
+    # Field names are interned so context lookups hit on identity
+    return tuple(
+        (literal, sys.intern(field) if field is not None else None)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+
+# Templates pre-split once so emitting a file is a single ''.join
+_TEMPLATE_PARTS = {name: _split_template(template) for name, template in _TEMPLATES.items()}
 
-    args = parser.parse_args()
 
+def _silent(*args, **kwargs):
+    """Stand-in for print() when progress output is suppressed."""
+
+
+class CodeGenerator:
+    """Generates Android code from SPEC."""
+
+    def __init__(
+        self,
+        spec: SpecDocument,
+        output_dir: Path,
+        package_name: str = "com.example.app",
+        quiet: bool = False,
+    ):
+        """Initialize code generator.
+
+        Args:
+            spec: Parsed SPEC document
+            output_dir: Output directory for generated code
+            package_name: Android package name for generated sources
+            quiet: Suppress progress output
+        """
+        self.spec = spec
+        self.output_dir = output_dir
+        self._log = _silent if quiet else print
+        # Interned: these few names are substituted dozens of times per run
+        self.package_name = sys.intern(package_name)
+        self.feature_name = sys.intern(spec.feature.replace(" ", "").replace("-", ""))
+        self._pkg_path = package_name.replace(".", "/")
+        self._feature_lower = self.feature_name.lower()
+        self._main_root = output_dir / "src" / "main" / "kotlin" / self._pkg_path
+        self._test_root = output_dir / "src" / "test" / "kotlin" / self._pkg_path
+
+        # One field table feeds the model, DTO and mapper fragments
+        self._fields = list(_BASE_FIELDS)
+
+        # Substitutions shared by every template
+        self._ctx = {
+            'package': self.package_name,
+            'feature': self.feature_name,
+            'feature_lower': self._feature_lower,
+            'spec_id': sys.intern(spec.spec_id),
+            'spec_feature': spec.feature,
+            'spec_feature_compact': spec.feature.replace(" ", ""),
+            'purpose': spec.purpose,
+            'model_fields': '\n    '.join(
+                f'val {f.name}: {f.kotlin_type},' for f in self._fields
+            ),
+            'dto_fields': '\n    '.join(
+                f'{f.dto_annotation} val {f.name}: {f.kotlin_type},'.lstrip() for f in self._fields
+            ),
+            'mapper_fields': '\n    '.join(f'{f.name} = {f.name},' for f in self._fields),
+        }
+
+    def generate_all(self):
+        """Generate all code layers."""
+        self._log(
+            f"\n{Colors.HEADER}{Colors.BOLD}=== Code Builder ==={Colors.ENDC}\n\n"
+            f"{Colors.OKBLUE}Generating code for: {self.spec.feature} (SPEC-{self.spec.spec_id}){Colors.ENDC}\n"
+            f"{Colors.OKBLUE}Related Skills: {len(self.spec.related_skills)}{Colors.ENDC}\n"
+        )
+
+        self._create_directory_structure()
+        files = (
+            self.generate_domain_layer()
+            + self.generate_data_layer()
+            + self.generate_presentation_layer()
+            + self.generate_tests()
+        )
+        self._write_files(files)
+
+        self._log(
+            f"\n{Colors.OKGREEN}{Colors.BOLD}✓ Code generation complete!{Colors.ENDC}\n"
+            f"{Colors.OKBLUE}Output: {self.output_dir}{Colors.ENDC}"
+        )
+
+    def _create_directory_structure(self):
+        """Create Clean Architecture directory structure."""
+        main_root = str(self._main_root)
+        test_root = str(self._test_root)
+
+        for leaf in _MAIN_DIRS:
+            os.makedirs(os.path.join(main_root, leaf), exist_ok=True)
+        for leaf in _TEST_DIRS:
+            os.makedirs(os.path.join(test_root, leaf), exist_ok=True)
+
+    def generate_domain_layer(self) -> List[Tuple[Path, str]]:
+        """Generate domain layer code.
+
+        Returns:
+            (path, content) pairs for the domain layer sources
+        """
+        self._log(f"{Colors.OKCYAN}Generating Domain Layer...{Colors.ENDC}")
+        files = []
+
+        # Generate model
+        model_code = self._generate_domain_model()
+        files.append((self._main_root / "domain/model" / f"{self.feature_name}.kt", model_code))
+
+        # Generate repository interface
+        repo_interface = self._generate_repository_interface()
+        files.append((self._main_root / "domain/repository" / f"{self.feature_name}Repository.kt", repo_interface))
+
+        # Generate use cases
+        usecases = self._generate_usecases()
+        for usecase_name, usecase_code in usecases:
+            files.append((self._main_root / "domain/usecase" / f"{usecase_name}.kt", usecase_code))
+
+        self._log(f"  {Colors.OKGREEN}✓ Domain layer complete{Colors.ENDC}")
+        return files
+
+    def generate_data_layer(self) -> List[Tuple[Path, str]]:
+        """Generate data layer code.
+
+        Returns:
+            (path, content) pairs for the data layer sources
+        """
+        self._log(f"{Colors.OKCYAN}Generating Data Layer...{Colors.ENDC}")
+        files = []
+
+        # Generate API interface
+        api_code = self._generate_api_interface()
+        files.append((self._main_root / "data/remote" / f"{self.feature_name}Api.kt", api_code))
+
+        # Generate DTOs
+        dto_code = self._generate_dtos()
+        files.append((self._main_root / "data/remote" / f"{self.feature_name}Dto.kt", dto_code))
+
+        # Generate repository implementation
+        repo_impl = self._generate_repository_implementation()
+        files.append((self._main_root / "data/repository" / f"{self.feature_name}RepositoryImpl.kt", repo_impl))
+
+        self._log(f"  {Colors.OKGREEN}✓ Data layer complete{Colors.ENDC}")
+        return files
+
+    def generate_presentation_layer(self) -> List[Tuple[Path, str]]:
+        """Generate presentation layer code.
+
+        Returns:
+            (path, content) pairs for the presentation layer sources
+        """
+        self._log(f"{Colors.OKCYAN}Generating Presentation Layer...{Colors.ENDC}")
+        files = []
+
+        # Generate state
+        state_code = self._generate_state()
+        files.append((self._main_root / "presentation/state" / f"{self.feature_name}State.kt", state_code))
+
+        # Generate ViewModel
+        viewmodel_code = self._generate_viewmodel()
+        files.append((self._main_root / "presentation/viewmodel" / f"{self.feature_name}ViewModel.kt", viewmodel_code))
+
+        # Generate Screen
+        screen_code = self._generate_screen()
+        files.append((self._main_root / "presentation/ui" / f"{self.feature_name}Screen.kt", screen_code))
+
+        self._log(f"  {Colors.OKGREEN}✓ Presentation layer complete{Colors.ENDC}")
+        return files
+
+    def generate_tests(self) -> List[Tuple[Path, str]]:
+        """Generate test files.
+
+        Returns:
+            (path, content) pairs for the test sources
+        """
+        self._log(f"{Colors.OKCYAN}Generating Tests...{Colors.ENDC}")
+
+        # Generate unit tests
+        test_code = self._generate_unit_tests()
+        test_file = self._test_root / "domain" / f"{self.feature_name}UseCaseTest.kt"
+
+        self._log(f"  {Colors.OKGREEN}✓ Tests complete{Colors.ENDC}")
+        return [(test_file, test_code)]
+
+    @staticmethod
+    def _write_files(files: List[Tuple[Path, str]]):
+        """Write generated files concurrently.
+
+        Directories are laid down up front by _create_directory_structure,
+        so workers only write.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda item: item[0].write_bytes(item[1].encode('utf-8')), files))
+
+    def _emit(self, name: str) -> str:
+        """Render a template by joining its literal chunks and field values."""
+        ctx = self._ctx
+        parts = []
+        for literal, field in _TEMPLATE_PARTS[name]:
+            parts.append(literal)
+            if field is not None:
+                parts.append(ctx[field])
+        return ''.join(parts)
+
+    def _generate_domain_model(self) -> str:
+        """Generate domain model."""
+        return self._emit('domain_model')
+
+    def _generate_repository_interface(self) -> str:
+        """Generate repository interface."""
+        return self._emit('repository_interface')
+
+    def _generate_usecases(self) -> List[Tuple[str, str]]:
+        """Generate use cases."""
+        usecases = []
+
+        usecase_name = f"Get{self.feature_name}UseCase"
+        usecase_code = self._emit('usecase')
+        usecases.append((usecase_name, usecase_code))
+
+        return usecases
+
+    def _generate_api_interface(self) -> str:
+        """Generate API interface."""
+        return self._emit('api_interface')
+
+    def _generate_dtos(self) -> str:
+        """Generate DTOs."""
+        return self._emit('dto')
+
+    def _generate_repository_implementation(self) -> str:
+        """Generate repository implementation."""
+        return self._emit('repository_implementation')
+
+    def _generate_state(self) -> str:
+        """Generate state classes."""
+        return self._emit('state')
+
+    def _generate_viewmodel(self) -> str:
+        """Generate ViewModel."""
+        return self._emit('viewmodel')
+
+    def _generate_screen(self) -> str:
+        """Generate Compose screen."""
+        return self._emit('screen')
+
+    def _generate_unit_tests(self) -> str:
+        """Generate unit tests."""
+        return self._emit('unit_tests')
+
+
+def generate(
+    spec_file: Path,
+    output: Path,
+    package: str = "com.example.app",
+    quiet: bool = False,
+) -> int:
+    """Generate code for a SPEC file.
+
+    Args:
+        spec_file: Path to SPEC.md
+        output: Output directory for generated code
+        package: Android package name
+        quiet: Suppress progress output; errors are still printed
+
+    Returns:
+        Exit code (0 on success)
+    """
     # Parse SPEC
-    spec_file = Path(args.spec_file)
+    spec_file = Path(spec_file)
     if not spec_file.exists():
         print(f"{Colors.FAIL}Error: SPEC file not found: {spec_file}{Colors.ENDC}")
-        sys.exit(1)
+        return 1
 
     try:
         spec = SpecParser.parse(spec_file)
     except Exception as e:
         print(f"{Colors.FAIL}Error parsing SPEC: {e}{Colors.ENDC}")
-        sys.exit(1)
+        return 1
 
     # Generate code
-    output_dir = Path(args.output)
-    generator = CodeGenerator(spec, output_dir)
-    generator.package_name = args.package
+    generator = CodeGenerator(spec, Path(output), package, quiet=quiet)
+    generator.generate_all()
+    return 0
+
+
+# Options understood by the argparse-free fast path in main()
+_FAST_OPTIONS = {'-o': 'output', '--output': 'output', '-p': 'package', '--package': 'package'}
+_FAST_FLAGS = {'-q': 'quiet', '--quiet': 'quiet'}
+
+
+def _parse_generate_args(argv: List[str]) -> Optional[Dict[str, str]]:
+    """Parse a plain `generate <spec_file> [-o DIR] [-p PKG] [-q]` command line.
+
+    Args:
+        argv: Arguments after the program name
+
+    Returns:
+        Parsed options, or None when argparse should handle the arguments
+    """
+    if len(argv) < 2 or argv[0] != 'generate':
+        return None
+
+    args = {'output': './generated', 'package': 'com.example.app', 'quiet': False}
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _FAST_FLAGS:
+            args[_FAST_FLAGS[arg]] = True
+            i += 1
+        elif arg in _FAST_OPTIONS and i + 1 < len(argv):
+            args[_FAST_OPTIONS[arg]] = argv[i + 1]
+            i += 2
+        elif arg.startswith('-') or 'spec_file' in args:
+            # Help, unknown flags and stray positionals go to argparse
+            return None
+        else:
+            args['spec_file'] = arg
+            i += 1
 
-    if args.command == "generate":
-        generator.generate_all()
+    return args if 'spec_file' in args else None
 
 
+def main():
+    """Main entry point."""
+    args = _parse_generate_args(sys.argv[1:])
+    if args is None:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Code Builder - Generate Android code from SPEC")
+        parser.add_argument("command", choices=["generate"], help="Command to execute")
+        parser.add_argument("spec_file", help="Path to SPEC.md file")
+        parser.add_argument("--output", "-o", help="Output directory", default="./generated")
+        parser.add_argument("--package", "-p", help="Package name", default="com.example.app")
+        parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress output")
+
+        args = vars(parser.parse_args())
+
+    exit_code = generate(
+        Path(args['spec_file']), Path(args['output']), args['package'], quiet=args['quiet']
+    )
+    if exit_code:
+        sys.exit(exit_code)
+
 if __name__ == "__main__":
     main()
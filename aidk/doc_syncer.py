@@ -11,11 +11,15 @@ Usage:
 """
 
 import argparse
+import os
 import re
+import stat
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 # ANSI colors
 class Colors:
@@ -29,8 +33,40 @@ class Colors:
     BOLD = '\033[1m'
 
 
-@dataclass
-class CodeReference:
+# Patterns compiled once at import
+# Pattern: // SPEC-XXX or // REQ-XXX-Y-ZZ (the gap may not span lines)
+_SPEC_REF_RE = re.compile(r'//[^\S\n]*((?:SPEC|REQ)-[A-Z0-9-]+)')
+_REQ_LINE_RE = re.compile(r'-\s+\*\*([A-Z0-9-]+)\*\*:')
+_FRONTMATTER_RE = re.compile(r'---\n(.*?)\n---', re.DOTALL)
+# Traceability matrix header as written by spec_builder; rows follow up to
+# the next blank line. The regex is the fallback for other separator widths.
+_TRACE_MATRIX_HEADER = (
+    "## 7. Traceability Matrix\n\n"
+    "| Requirement | Code File | Test File | Status |\n"
+    "|-------------|-----------|-----------|--------|\n"
+)
+_TRACE_MATRIX_RE = re.compile(
+    r'## 7\. Traceability Matrix\n\n'
+    r'\| Requirement \| Code File \| Test File \| Status \|\n'
+    r'\|-+\|-+\|-+\|-+\|\n(.*?)\n\n',
+    re.DOTALL
+)
+# Architecture layers, in the order architecture.md lists them
+_LAYERS = ("presentation", "domain", "data")
+# Directories never scanned for Kotlin sources (hidden ones are skipped too)
+_SKIP_DIRS = frozenset(('.git', '.gradle', 'node_modules'))
+# Gradle output directory; only pruned where Gradle would put it, so source
+# packages named "build" (e.g. com.example.build) are still scanned
+_BUILD_DIR = 'build'
+# Files marking a Gradle project or module directory
+_GRADLE_BUILD_FILES = ('build.gradle', 'build.gradle.kts')
+# Files larger than this are generated or vendored, not hand-written code
+_MAX_FILE_SIZE = 2_000_000
+# Frontmatter fields reported by parse_metadata
+_META_FIELDS = frozenset(('spec_id', 'feature', 'version', 'status'))
+
+
+class CodeReference(NamedTuple):
     """Reference to code implementing a requirement."""
     file_path: str
     line_number: int
@@ -48,42 +84,149 @@ class SyncReport:
     code_files: List[str]
     test_files: List[str]
     mismatches: List[str]
+    # Unique requirement IDs in the order the SPEC lists them
+    requirement_order: List[str] = field(default_factory=list)
+    # Sorted views shared by the printer and the generated docs
+    implemented_sorted: List[str] = field(init=False, repr=False)
+    missing_sorted: List[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.implemented_sorted = sorted(self.implemented_requirements)
+        self.missing_sorted = sorted(self.missing_requirements)
 
 
 class CodeAnalyzer:
     """Analyzes code for SPEC references."""
 
     @staticmethod
-    def find_spec_references(code_dir: Path) -> Dict[str, List[CodeReference]]:
-        """Find all SPEC ID references in code.
+    def _scan_file(path: str, rel_path: str, count_tests: bool,
+                   find_references: bool = True) -> Tuple[List[CodeReference], int]:
+        """Scan one Kotlin file for SPEC references and @Test annotations.
+
+        Args:
+            path: File path to open
+            rel_path: Path recorded in the returned references
+            count_tests: Whether to count @Test annotations
+            find_references: Whether to search for SPEC references
+
+        Returns:
+            Tuple of (references in file order, number of test methods)
+        """
+        refs: List[CodeReference] = []
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        test_count = content.count('@Test') if count_tests else 0
+
+        # Cheap literal checks first; most files carry few or no markers
+        if not find_references or '//' not in content or ('REQ-' not in content and 'SPEC-' not in content):
+            return refs, test_count
+
+        # One regex pass over the whole file. Line numbers are counted
+        # incrementally from the previous match instead of splitting lines.
+        line_num = 1
+        last = 0
+        for match in _SPEC_REF_RE.finditer(content):
+            start = match.start()
+            line_num += content.count('\n', last, start)
+            last = start
+            refs.append(CodeReference(
+                file_path=rel_path,
+                line_number=line_num,
+                requirement_id=match.group(1)
+            ))
+
+        return refs, test_count
+
+    @staticmethod
+    def scan(code_dir: Path,
+             find_references: bool = True) -> Tuple[Dict[str, List[CodeReference]], List[str], List[str], int]:
+        """Collect references, source files and test stats in one walk.
+
+        Every Kotlin file is opened once: its lines are searched for SPEC
+        references and, for test files under src/test, for @Test annotations.
+        Files are scanned on a thread pool; results are merged in walk order.
+        Without reference search only test files are opened. Build output
+        (build/ at the top or beside a Gradle build file), VCS and hidden
+        directories are pruned; symlinks and files over
+        _MAX_FILE_SIZE bytes are skipped.
 
         Args:
             code_dir: Directory containing code
+            find_references: Whether to search for SPEC references
 
         Returns:
-            Dict mapping requirement IDs to code references
+            Tuple of (requirement ID -> code references, non-test source
+            files, test files, number of test methods)
         """
+        code_files: List[str] = []
+        test_files: List[str] = []
+        paths: List[str] = []
+        rel_paths: List[str] = []
+        count_tests: List[bool] = []
+
+        test_root = os.path.join("src", "test")
+        # os.walk is built on os.scandir, so file/dir checks reuse the
+        # type info fetched while listing each directory
+        for root, dirs, files in os.walk(code_dir):
+            rel_dir = os.path.relpath(root, code_dir)
+            rel_dir = "" if rel_dir == os.curdir else rel_dir
+            skip_build = not rel_dir or any(f in files for f in _GRADLE_BUILD_FILES)
+            dirs[:] = sorted(
+                d for d in dirs
+                if d not in _SKIP_DIRS and not d.startswith('.')
+                and not (skip_build and d == _BUILD_DIR)
+            )
+            in_test_tree = "test" in rel_dir.split(os.sep)
+            in_src_test = rel_dir == test_root or rel_dir.startswith(test_root + os.sep)
+
+            for name in sorted(files):
+                if not name.endswith(".kt"):
+                    continue
+
+                path = os.path.join(root, name)
+                st = os.lstat(path)
+                if stat.S_ISLNK(st.st_mode) or st.st_size > _MAX_FILE_SIZE:
+                    continue
+
+                rel_path = os.path.join(rel_dir, name)
+                is_test_file = in_src_test and name.endswith("Test.kt")
+                if is_test_file:
+                    test_files.append(rel_path)
+                elif not in_test_tree:
+                    code_files.append(rel_path)
+
+                if not (find_references or is_test_file):
+                    continue
+
+                paths.append(path)
+                rel_paths.append(rel_path)
+                count_tests.append(is_test_file)
+
         references: Dict[str, List[CodeReference]] = {}
+        test_count = 0
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for refs, file_tests in executor.map(CodeAnalyzer._scan_file, paths, rel_paths, count_tests,
+                                                     repeat(find_references)):
+                test_count += file_tests
+                for ref in refs:
+                    references.setdefault(ref.requirement_id, []).append(ref)
 
-        # Find all Kotlin files
-        for kt_file in code_dir.rglob("*.kt"):
-            with open(kt_file, 'r') as f:
-                lines = f.readlines()
+        return references, code_files, test_files, test_count
 
-            for line_num, line in enumerate(lines, 1):
-                # Pattern: // SPEC-XXX or // REQ-XXX-Y-ZZ
-                matches = re.findall(r'//\s*((?:SPEC|REQ)-[A-Z0-9-]+)', line)
-                for match in matches:
-                    if match not in references:
-                        references[match] = []
+    @staticmethod
+    def find_spec_references(code_dir: Path) -> Dict[str, List[CodeReference]]:
+        """Find all SPEC ID references in code.
 
-                    references[match].append(CodeReference(
-                        file_path=str(kt_file.relative_to(code_dir)),
-                        line_number=line_num,
-                        requirement_id=match
-                    ))
+        Args:
+            code_dir: Directory containing code
 
-        return references
+        Returns:
+            Dict mapping requirement IDs to code references
+        """
+        return CodeAnalyzer.scan(code_dir)[0]
 
     @staticmethod
     def find_test_files(code_dir: Path) -> List[str]:
@@ -116,61 +259,71 @@ class CodeAnalyzer:
         """
         count = 0
         for test_file in test_dir.rglob("*Test.kt"):
-            with open(test_file, 'r') as f:
-                content = f.read()
-                # Count @Test annotations
-                count += len(re.findall(r'@Test', content))
+            # Count @Test annotations
+            count += test_file.read_text(encoding='utf-8').count('@Test')
 
         return count
 
 
 class SpecParser:
-    """Parses SPEC documents."""
+    """Parses SPEC documents.
+
+    Parsers take either a Path to SPEC.md or the SPEC text itself, so
+    callers that already hold the content don't re-read the file.
+    """
 
     @staticmethod
-    def parse_requirements(spec_file: Path) -> List[str]:
+    def _content(spec: Union[Path, str]) -> str:
+        """Return SPEC text, reading it when given a Path."""
+        if isinstance(spec, str):
+            return spec
+        return spec.read_text(encoding='utf-8')
+
+    @staticmethod
+    def parse_requirements(spec: Union[Path, str]) -> List[str]:
         """Parse requirement IDs from SPEC.
 
         Args:
-            spec_file: Path to SPEC.md
+            spec: Path to SPEC.md, or its text
 
         Returns:
             List of requirement IDs
         """
-        with open(spec_file, 'r') as f:
-            content = f.read()
+        content = SpecParser._content(spec)
 
         # Pattern: - **REQ-XXX-Y-ZZ**:
-        requirements = re.findall(r'-\s+\*\*([A-Z0-9-]+)\*\*:', content)
+        requirements = _REQ_LINE_RE.findall(content)
 
         # Filter to only REQ- IDs
         return [req for req in requirements if req.startswith('REQ-')]
 
     @staticmethod
-    def parse_metadata(spec_file: Path) -> Dict[str, str]:
+    def parse_metadata(spec: Union[Path, str]) -> Dict[str, str]:
         """Parse SPEC metadata.
 
         Args:
-            spec_file: Path to SPEC.md
+            spec: Path to SPEC.md, or its text
 
         Returns:
             Dict of metadata
         """
-        with open(spec_file, 'r') as f:
-            content = f.read()
+        content = SpecParser._content(spec)
 
         metadata = {}
 
         # Extract frontmatter
-        frontmatter_match = re.search(r'---\n(.*?)\n---', content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.search(content)
         if frontmatter_match:
             frontmatter = frontmatter_match.group(1)
 
-            # Extract fields
-            for field in ['spec_id', 'feature', 'version', 'status']:
-                match = re.search(rf'{field}:\s*(.+)', frontmatter)
-                if match:
-                    metadata[field] = match.group(1).strip()
+            # Extract fields in one pass over the `key: value` lines;
+            # the first occurrence of a field wins
+            for line in frontmatter.splitlines():
+                key, sep, value = line.partition(':')
+                key = key.strip()
+                value = value.strip()
+                if sep and value and key in _META_FIELDS and key not in metadata:
+                    metadata[key] = value
 
         return metadata
 
@@ -188,6 +341,10 @@ class DocSyncer:
         self.spec_file = spec_file
         self.code_dir = code_dir
         self.spec_dir = spec_file.parent
+        # SPEC text is read once and shared by every parse/update step
+        self._spec_text = spec_file.read_text(encoding='utf-8')
+        # Filled by verify() and reused by sync() steps
+        self._references: Dict[str, List[CodeReference]] = {}
 
     def verify(self) -> SyncReport:
         """Verify SPEC-code alignment.
@@ -198,15 +355,17 @@ class DocSyncer:
         print(f"\n{Colors.HEADER}{Colors.BOLD}=== Doc Syncer - Verification ==={Colors.ENDC}\n")
 
         # Parse SPEC
-        metadata = SpecParser.parse_metadata(self.spec_file)
-        requirements = SpecParser.parse_requirements(self.spec_file)
+        metadata = SpecParser.parse_metadata(self._spec_text)
+        requirements = SpecParser.parse_requirements(self._spec_text)
 
         print(f"{Colors.OKBLUE}SPEC: {metadata.get('feature', 'Unknown')} ({metadata.get('spec_id', 'Unknown')}){Colors.ENDC}")
         print(f"{Colors.OKBLUE}Total Requirements: {len(requirements)}{Colors.ENDC}\n")
 
-        # Analyze code
-        references = CodeAnalyzer.find_spec_references(self.code_dir)
-        test_files = CodeAnalyzer.find_test_files(self.code_dir)
+        # Analyze code in a single walk of the code tree. With no
+        # requirements there is nothing to trace, so skip the reference search.
+        references, code_files, test_files, test_count = CodeAnalyzer.scan(
+            self.code_dir, find_references=bool(requirements))
+        self._references = references
 
         # Find implemented requirements
         implemented = set()
@@ -216,13 +375,6 @@ class DocSyncer:
 
         missing = set(requirements) - implemented
 
-        # Find all code files
-        code_files = [
-            str(f.relative_to(self.code_dir))
-            for f in self.code_dir.rglob("*.kt")
-            if "/test/" not in str(f)
-        ]
-
         # Create report
         report = SyncReport(
             spec_id=metadata.get('spec_id', 'Unknown'),
@@ -232,11 +384,12 @@ class DocSyncer:
             missing_requirements=missing,
             code_files=code_files,
             test_files=test_files,
-            mismatches=[]
+            mismatches=[],
+            requirement_order=list(dict.fromkeys(requirements))
         )
 
         # Print results
-        self._print_verification_results(report, references)
+        self._print_verification_results(report, references, test_count)
 
         return report
 
@@ -267,7 +420,12 @@ class DocSyncer:
 
         return report
 
-    def _print_verification_results(self, report: SyncReport, references: Dict[str, List[CodeReference]]):
+    def _print_verification_results(
+        self,
+        report: SyncReport,
+        references: Dict[str, List[CodeReference]],
+        test_count: int,
+    ):
         """Print verification results."""
         # Implementation status
         impl_percentage = (len(report.implemented_requirements) / report.total_requirements * 100) if report.total_requirements > 0 else 0
@@ -278,7 +436,7 @@ class DocSyncer:
 
         if report.implemented_requirements:
             print(f"\n{Colors.OKGREEN}Implemented Requirements:{Colors.ENDC}")
-            for req_id in sorted(report.implemented_requirements):
+            for req_id in report.implemented_sorted:
                 refs = references.get(req_id, [])
                 print(f"  ✓ {req_id}")
                 for ref in refs:
@@ -286,7 +444,7 @@ class DocSyncer:
 
         if report.missing_requirements:
             print(f"\n{Colors.WARNING}Missing Requirements:{Colors.ENDC}")
-            for req_id in sorted(report.missing_requirements):
+            for req_id in report.missing_sorted:
                 print(f"  ✗ {req_id}")
 
         # Code files
@@ -297,28 +455,32 @@ class DocSyncer:
         # Test coverage
         test_dir = self.code_dir / "src" / "test"
         if test_dir.exists():
-            test_count = CodeAnalyzer.count_test_coverage(test_dir)
             print(f"  Test methods: {test_count}")
 
     def _update_traceability_matrix(self, report: SyncReport):
         """Update traceability matrix in SPEC."""
-        with open(self.spec_file, 'r') as f:
-            content = f.read()
-
-        # Find traceability matrix section
-        matrix_pattern = r'## 7\. Traceability Matrix\n\n\| Requirement \| Code File \| Test File \| Status \|\n\|-------------|-----------|-----------|--------|\n(.*?)\n\n'
-        matrix_match = re.search(matrix_pattern, content, re.DOTALL)
-
-        if not matrix_match:
-            print(f"  {Colors.WARNING}Warning: Traceability matrix section not found{Colors.ENDC}")
-            return
-
-        # Build new matrix rows
-        references = CodeAnalyzer.find_spec_references(self.code_dir)
+        content = self._spec_text
+
+        # Find the matrix rows: locate the literal header first and only
+        # fall back to the regex when the header is formatted differently
+        rows_start = rows_end = -1
+        header = content.find(_TRACE_MATRIX_HEADER)
+        if header != -1:
+            rows_start = header + len(_TRACE_MATRIX_HEADER)
+            rows_end = content.find("\n\n", rows_start)
+        if rows_end == -1:
+            matrix_match = _TRACE_MATRIX_RE.search(content)
+            if not matrix_match:
+                print(f"  {Colors.WARNING}Warning: Traceability matrix section not found{Colors.ENDC}")
+                return
+            rows_start, rows_end = matrix_match.span(1)
+
+        # Build new matrix rows from the references collected by verify()
+        references = self._references
         new_rows = []
 
-        all_reqs = report.implemented_requirements | report.missing_requirements
-        for req_id in sorted(all_reqs):
+        # Rows follow SPEC order, which keeps matrix diffs readable
+        for req_id in report.requirement_order:
             code_file = "—"
             test_file = "—"
             status = "⏳ Pending"
@@ -333,17 +495,12 @@ class DocSyncer:
 
         new_matrix = "\n".join(new_rows)
 
-        # Replace matrix
-        new_content = re.sub(
-            matrix_pattern,
-            f"## 7. Traceability Matrix\n\n| Requirement | Code File | Test File | Status |\n|-------------|-----------|-----------|--------|\n{new_matrix}\n\n",
-            content,
-            flags=re.DOTALL
-        )
+        # Replace matrix rows
+        new_content = content[:rows_start] + new_matrix + content[rows_end:]
 
         # Write back
-        with open(self.spec_file, 'w') as f:
-            f.write(new_content)
+        self.spec_file.write_text(new_content, encoding='utf-8')
+        self._spec_text = new_content
 
         print(f"  {Colors.OKGREEN}✓ Traceability matrix updated{Colors.ENDC}")
 
@@ -353,7 +510,7 @@ class DocSyncer:
 
         impl_percentage = (len(report.implemented_requirements) / report.total_requirements * 100) if report.total_requirements > 0 else 0.0
 
-        content = f"""# {report.feature}
+        parts = [f"""# {report.feature}
 
 ## Overview
 
@@ -369,17 +526,17 @@ SPEC ID: {report.spec_id}
 
 ### Implemented
 
-"""
+"""]
 
-        for req_id in sorted(report.implemented_requirements):
-            content += f"- ✅ {req_id}\n"
+        for req_id in report.implemented_sorted:
+            parts.append(f"- ✅ {req_id}\n")
 
         if report.missing_requirements:
-            content += "\n### Pending\n\n"
-            for req_id in sorted(report.missing_requirements):
-                content += f"- ⏳ {req_id}\n"
+            parts.append("\n### Pending\n\n")
+            for req_id in report.missing_sorted:
+                parts.append(f"- ⏳ {req_id}\n")
 
-        content += f"""
+        parts.append(f"""
 ## Architecture
 
 This feature follows Clean Architecture with three layers:
@@ -403,17 +560,17 @@ This feature follows Clean Architecture with three layers:
 
 ### Source Files
 
-"""
+""")
 
         for file_path in sorted(report.code_files):
-            content += f"- `{file_path}`\n"
+            parts.append(f"- `{file_path}`\n")
 
-        content += "\n### Test Files\n\n"
+        parts.append("\n### Test Files\n\n")
 
         for file_path in sorted(report.test_files):
-            content += f"- `{file_path}`\n"
+            parts.append(f"- `{file_path}`\n")
 
-        content += f"""
+        parts.append(f"""
 ## References
 
 - [SPEC Document](./SPEC.md)
@@ -422,10 +579,10 @@ This feature follows Clean Architecture with three layers:
 ---
 
 *Generated by Doc Syncer*
-"""
+""")
 
-        with open(readme_path, 'w') as f:
-            f.write(content)
+        content = "".join(parts)
+        readme_path.write_text(content, encoding='utf-8')
 
         print(f"  {Colors.OKGREEN}✓ README generated: {readme_path}{Colors.ENDC}")
 
@@ -433,7 +590,7 @@ This feature follows Clean Architecture with three layers:
         """Generate architecture diagram."""
         diagram_path = self.spec_dir / "architecture.md"
 
-        content = f"""# {report.feature} - Architecture
+        parts = [f"""# {report.feature} - Architecture
 
 ## Clean Architecture Layers
 
@@ -477,28 +634,24 @@ This feature follows Clean Architecture with three layers:
 
 ### Presentation Layer
 
-"""
-
-        # List presentation files
-        presentation_files = [f for f in report.code_files if "/presentation/" in f]
-        for file_path in presentation_files:
-            content += f"- `{file_path}`\n"
-
-        content += "\n### Domain Layer\n\n"
-
-        # List domain files
-        domain_files = [f for f in report.code_files if "/domain/" in f]
-        for file_path in domain_files:
-            content += f"- `{file_path}`\n"
+"""]
 
-        content += "\n### Data Layer\n\n"
+        # Partition files by layer in one pass; a file lands in the first
+        # layer whose directory appears in its path
+        layers: Dict[str, List[str]] = {layer: [] for layer in _LAYERS}
+        for file_path in report.code_files:
+            for layer in _LAYERS:
+                if f"{os.sep}{layer}{os.sep}" in file_path:
+                    layers[layer].append(file_path)
+                    break
 
-        # List data files
-        data_files = [f for f in report.code_files if "/data/" in f]
-        for file_path in data_files:
-            content += f"- `{file_path}`\n"
+        parts.extend(f"- `{file_path}`\n" for file_path in layers["presentation"])
+        parts.append("\n### Domain Layer\n\n")
+        parts.extend(f"- `{file_path}`\n" for file_path in layers["domain"])
+        parts.append("\n### Data Layer\n\n")
+        parts.extend(f"- `{file_path}`\n" for file_path in layers["data"])
 
-        content += f"""
+        parts.append(f"""
 ## Dependency Flow
 
 ```
@@ -512,14 +665,64 @@ Presentation → Domain → Data
 ---
 
 *Generated by Doc Syncer*
-"""
+""")
 
-        with open(diagram_path, 'w') as f:
-            f.write(content)
+        content = "".join(parts)
+        diagram_path.write_text(content, encoding='utf-8')
 
         print(f"  {Colors.OKGREEN}✓ Architecture diagram generated: {diagram_path}{Colors.ENDC}")
 
 
+def _check_paths(spec_file: Path, code_dir: Path) -> bool:
+    """Report missing inputs; return True when both paths exist."""
+    if not spec_file.exists():
+        print(f"{Colors.FAIL}Error: SPEC file not found: {spec_file}{Colors.ENDC}")
+        return False
+
+    if not code_dir.exists():
+        print(f"{Colors.FAIL}Error: Code directory not found: {code_dir}{Colors.ENDC}")
+        return False
+
+    return True
+
+
+def verify(spec_file: Path, code_dir: Path) -> int:
+    """Verify SPEC-code alignment.
+
+    Args:
+        spec_file: Path to SPEC.md
+        code_dir: Code directory
+
+    Returns:
+        Exit code (1 if paths are missing or requirements are unimplemented)
+    """
+    spec_file, code_dir = Path(spec_file), Path(code_dir)
+    if not _check_paths(spec_file, code_dir):
+        return 1
+
+    report = DocSyncer(spec_file, code_dir).verify()
+    # Exit with error if there are missing requirements
+    return 1 if report.missing_requirements else 0
+
+
+def sync(spec_file: Path, code_dir: Path) -> int:
+    """Synchronize SPEC traceability, README and architecture docs.
+
+    Args:
+        spec_file: Path to SPEC.md
+        code_dir: Code directory
+
+    Returns:
+        Exit code (0 on success)
+    """
+    spec_file, code_dir = Path(spec_file), Path(code_dir)
+    if not _check_paths(spec_file, code_dir):
+        return 1
+
+    DocSyncer(spec_file, code_dir).sync()
+    return 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Doc Syncer - Synchronize SPEC, code, and docs")
@@ -529,28 +732,13 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate paths
-    spec_file = Path(args.spec_file)
-    code_dir = Path(args.code)
-
-    if not spec_file.exists():
-        print(f"{Colors.FAIL}Error: SPEC file not found: {spec_file}{Colors.ENDC}")
-        sys.exit(1)
-
-    if not code_dir.exists():
-        print(f"{Colors.FAIL}Error: Code directory not found: {code_dir}{Colors.ENDC}")
-        sys.exit(1)
-
-    # Run syncer
-    syncer = DocSyncer(spec_file, code_dir)
-
     if args.command == "verify":
-        report = syncer.verify()
-        # Exit with error if there are missing requirements
-        if report.missing_requirements:
-            sys.exit(1)
-    elif args.command == "sync":
-        syncer.sync()
+        exit_code = verify(Path(args.spec_file), Path(args.code))
+    else:
+        exit_code = sync(Path(args.spec_file), Path(args.code))
+
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -6,17 +6,282 @@ Handles installation of AIDK skills, templates, and tools to Claude Code project
 Supports both local (project-specific) and global installations.
 """
 
+import functools
 import json
+import os
+import pkgutil
 import shutil
+import stat
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from aidk import SKILLS_DIR, TEMPLATES_DIR, EXAMPLES_DIR, __version__
+from aidk.skill_index import SKILL_INDEX_NAME, Skill, iter_skill_dirs, load_index, read_skills
 
 console = Console()
 
+# Bytes moved per copy syscall by _fast_copytree
+_COPY_CHUNK = 1 << 20
+# Windows needs O_BINARY to avoid newline translation on raw fds
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# Page-cache hints for source files (POSIX only)
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+# Concurrent tree copies; the work is syscall-bound, so threads overlap well
+_COPY_WORKERS = 8
+# Bytes read per file when warming the page cache (AIDK_PREFETCH=1)
+_PREFETCH_BYTES = 4096
+# Hook script copied into the project's tools/ directory
+_HOOK_SCRIPT = Path(__file__).parent / "spec_prompt_hook.py"
+# Fewer skills than this install too quickly for a spinner to be worth drawing
+_PROGRESS_MIN_ITEMS = 8
+# Tags _replace_tree's staging and trash copies: .<name>.aidk-<pid>.new/.old
+_STALE_MARKER = ".aidk-"
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> None:
+    """
+    Copy the remaining bytes of one open file into another.
+
+    Uses copy_file_range/sendfile so the data stays in kernel space where
+    the platform supports it, falling back to a buffered read/write loop.
+    Some filesystems report end of file from copy_file_range without
+    copying anything, so a method that stops short of size hands over to
+    the next one at the current offsets.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        size: Source file size, from its stat result
+    """
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while True:
+                count = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK)
+                if not count:
+                    break
+                copied += count
+        except OSError:
+            pass  # e.g. cross-filesystem on older kernels; file offsets are kept
+        if copied >= size:
+            return
+
+    if sys.platform.startswith("linux"):
+        offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, _COPY_CHUNK)
+                if not sent:
+                    break
+                offset += sent
+                copied += sent
+        except OSError:
+            pass
+        # sendfile leaves the source offset alone; the fallback reads from it
+        os.lseek(src_fd, offset, os.SEEK_SET)
+        if copied >= size:
+            return
+
+    while True:
+        chunk = os.read(src_fd, _COPY_CHUNK)
+        if not chunk:
+            return
+        os.write(dst_fd, chunk)
+
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path], st: os.stat_result) -> None:
+    """
+    Copy one file's data, permission bits and timestamps.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+        st: Already fetched stat result of the source
+    """
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        # Whole-file sequential read: ask for read-ahead now, and drop the
+        # source pages afterwards so bulk installs don't evict hotter data
+        if _HAS_FADVISE:
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd, st.st_size)
+        finally:
+            os.close(dst_fd)
+        if _HAS_FADVISE:
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(src_fd)
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """
+    Recursively copy a directory tree, like shutil.copytree.
+
+    The tree is walked with os.scandir so each entry's stat is fetched once
+    and reused for the type check and the metadata copy. Symlinks are
+    followed, matching shutil.copytree's default. Permission bits and
+    timestamps are copied for directories as well as files.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created)
+
+    Raises:
+        FileExistsError: If dst or a directory inside it already exists
+    """
+    os.makedirs(dst)
+
+    # Directory metadata is applied last, children first: creating entries
+    # would bump the mtimes, and a read-only mode would block the copy
+    dirs = [(os.fspath(dst), os.stat(src))]
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    os.mkdir(target)
+                    stack.append((entry.path, target))
+                    dirs.append((target, entry.stat()))
+                else:
+                    _copy_file(entry.path, target, entry.stat())
+
+    for path, st in reversed(dirs):
+        os.chmod(path, stat.S_IMODE(st.st_mode))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _replace_tree(src: Path, dst: Path, exists: bool) -> None:
+    """
+    Copy src to dst, replacing an existing dst.
+
+    An existing dst is replaced by copying next to it and swapping the two
+    with renames, so dst is never left half-written. The old tree is then
+    deleted on a separate thread instead of blocking the install. Both
+    copies get hidden names (see _STALE_MARKER), so one left behind by an
+    interrupted install is not picked up as a skill.
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        exists: Whether dst already exists
+    """
+    if not exists:
+        _fast_copytree(src, dst)
+        return
+
+    prefix = f".{dst.name}{_STALE_MARKER}{os.getpid()}"
+    staging = dst.with_name(prefix + ".new")
+    trash = dst.with_name(prefix + ".old")
+
+    try:
+        _fast_copytree(src, staging)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    os.replace(dst, trash)
+    os.replace(staging, dst)
+    # Not a daemon thread: interpreter exit waits for the delete to finish
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
+
+
+def _sweep_stale_copies(directory: Path, names: Set[str]) -> None:
+    """
+    Delete staging and trash copies left behind by an interrupted install.
+
+    Copies tagged with this process's pid are skipped, since a trash tree
+    may still be being deleted in the background.
+
+    Args:
+        directory: Install target directory
+        names: Names present in directory, from _existing_names
+    """
+    own_tag = f"{_STALE_MARKER}{os.getpid()}."
+    for name in names:
+        if (
+            name.startswith(".")
+            and _STALE_MARKER in name
+            and name.endswith((".new", ".old"))
+            and own_tag not in name
+        ):
+            shutil.rmtree(directory / name, ignore_errors=True)
+
+
+def _prefetch_trees(roots: List[Path], stop: threading.Event) -> None:
+    """
+    Read the head of every file under each root, in order.
+
+    Runs ahead of the copy workers so that on slow (network) filesystems
+    the first-read latency of upcoming skills overlaps with current copies.
+
+    Args:
+        roots: Source directories, in the order they will be copied
+        stop: Set by the caller once copying is finished or has failed
+    """
+    for root in roots:
+        for dirpath, _, files in os.walk(root):
+            for name in files:
+                if stop.is_set():
+                    return
+                try:
+                    with open(os.path.join(dirpath, name), 'rb') as f:
+                        f.read(_PREFETCH_BYTES)
+                except OSError:
+                    pass
+
+
+def _existing_names(directory: Path) -> Set[str]:
+    """
+    Names already present in a directory, from a single listing.
+
+    Install targets are checked against this set instead of stat'ing
+    each destination path.
+    """
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+def _iter_skills() -> List[os.DirEntry]:
+    """
+    List the bundled skill directories, sorted by name.
+
+    Returns:
+        DirEntry objects for every android-* directory in SKILLS_DIR
+    """
+    return iter_skill_dirs(SKILLS_DIR)
+
+
+def _iter_templates() -> List[os.DirEntry]:
+    """
+    List the bundled SPEC templates, sorted by name.
+
+    Returns:
+        DirEntry objects for every .md file in TEMPLATES_DIR
+    """
+    with os.scandir(TEMPLATES_DIR) as entries:
+        return sorted(
+            (entry for entry in entries if entry.name.endswith(".md") and entry.is_file()),
+            key=lambda entry: entry.name
+        )
+
 
 def find_claude_directory(project_dir: Path) -> Optional[Path]:
     """
@@ -44,6 +309,97 @@ def find_claude_directory(project_dir: Path) -> Optional[Path]:
     return claude_dir
 
 
+def _report_copies(futures: Dict[Future, str], report: Callable[[str], None]) -> bool:
+    """
+    Report finished tree copies in submission order.
+
+    Copies finish in a different order on every run; reporting them in the
+    order they were submitted (sorted by name) keeps the install log stable.
+    Cancelled copies are not reported.
+
+    Args:
+        futures: Copy futures mapped to the name being installed
+        report: Prints one status line
+
+    Returns:
+        True if every reported copy succeeded
+    """
+    succeeded = True
+    for future, name in futures.items():
+        if future.cancelled():
+            continue
+        error = future.exception()
+        if error is None:
+            report(f"✅ Installed: {name}")
+        else:
+            report(f"❌ Failed to install {name}: {error}")
+            succeeded = False
+    return succeeded
+
+
+def _install_skill_dirs(
+    skills: List[os.DirEntry],
+    skills_target: Path,
+    force: bool,
+    report: Callable[[str], None],
+    advance: Callable[[], None] = lambda: None
+) -> bool:
+    """
+    Copy skill directories into the project, reporting each one.
+
+    Args:
+        skills: Skill directories to install
+        skills_target: Destination skills directory
+        force: Overwrite existing skills
+        report: Prints one status line
+        advance: Called once per skill handled
+
+    Returns:
+        True if every skill was installed or skipped
+    """
+    existing = _existing_names(skills_target)
+    _sweep_stale_copies(skills_target, existing)
+    pending = []
+    for entry in skills:
+        skill_name = entry.name
+        exists = skill_name in existing
+
+        if exists and not force:
+            report(f"⏭️  Skipping {skill_name} (already exists)")
+            advance()
+            continue
+
+        pending.append((Path(entry.path), skills_target / skill_name, exists))
+
+    # Opt-in cache warming for slow filesystems
+    stop_prefetch = threading.Event()
+    if os.environ.get("AIDK_PREFETCH") == "1":
+        threading.Thread(
+            target=_prefetch_trees,
+            args=([skill_dir for skill_dir, _, _ in pending], stop_prefetch),
+            daemon=True
+        ).start()
+
+    # Copy skills concurrently. Completions only drive the progress bar and
+    # the early stop: after the first failure, queued copies are cancelled.
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(_COPY_WORKERS, len(pending)))) as executor:
+            futures = {
+                executor.submit(_replace_tree, skill_dir, target_skill, exists): skill_dir.name
+                for skill_dir, target_skill, exists in pending
+            }
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    for other in futures:
+                        other.cancel()
+                    break
+                advance()
+    finally:
+        stop_prefetch.set()
+
+    return _report_copies(futures, report)
+
+
 def install_skills(claude_dir: Path, force: bool = False) -> bool:
     """
     Install all AIDK skills to the Claude Code project.
@@ -59,7 +415,7 @@ def install_skills(claude_dir: Path, force: bool = False) -> bool:
     skills_target.mkdir(parents=True, exist_ok=True)
 
     # Get list of skills
-    skills = list(SKILLS_DIR.glob("android-*"))
+    skills = _iter_skills()
 
     if not skills:
         console.print(f"❌ [red]No skills found in: {SKILLS_DIR}[/red]")
@@ -67,36 +423,29 @@ def install_skills(claude_dir: Path, force: bool = False) -> bool:
 
     console.print(f"\n📦 Installing {len(skills)} Android skills...")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Installing skills...", total=len(skills))
-
-        for skill_dir in skills:
-            if not skill_dir.is_dir():
-                continue
-
-            skill_name = skill_dir.name
-            target_skill = skills_target / skill_name
-
-            if target_skill.exists() and not force:
-                progress.console.print(f"⏭️  Skipping {skill_name} (already exists)")
-                progress.advance(task)
-                continue
-
-            try:
-                if target_skill.exists():
-                    shutil.rmtree(target_skill)
-
-                shutil.copytree(skill_dir, target_skill)
-                progress.console.print(f"✅ Installed: {skill_name}")
-                progress.advance(task)
-
-            except Exception as e:
-                progress.console.print(f"❌ Failed to install {skill_name}: {e}")
-                return False
+    # Status lines are collected and printed in one go after the copies
+    lines: List[str] = []
+
+    # A live spinner only pays off on a terminal with enough items to watch
+    if console.is_terminal and len(skills) >= _PROGRESS_MIN_ITEMS:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Installing skills...", total=len(skills))
+            installed = _install_skill_dirs(
+                skills, skills_target, force,
+                report=lines.append,
+                advance=lambda: progress.advance(task)
+            )
+    else:
+        installed = _install_skill_dirs(skills, skills_target, force, report=lines.append)
+
+    if lines:
+        console.print("\n".join(lines))
+    if not installed:
+        return False
 
     console.print(f"\n✨ Successfully installed {len(skills)} skills!")
     return True
@@ -116,7 +465,7 @@ def install_templates(project_dir: Path, force: bool = False) -> bool:
     templates_target = project_dir / "specs" / "templates"
     templates_target.mkdir(parents=True, exist_ok=True)
 
-    templates = list(TEMPLATES_DIR.glob("*.md"))
+    templates = _iter_templates()
 
     if not templates:
         console.print(f"⚠️  [yellow]No templates found in: {TEMPLATES_DIR}[/yellow]")
@@ -124,21 +473,27 @@ def install_templates(project_dir: Path, force: bool = False) -> bool:
 
     console.print(f"\n📄 Installing {len(templates)} SPEC templates...")
 
-    for template_file in templates:
-        target_file = templates_target / template_file.name
+    existing = _existing_names(templates_target)
+    lines: List[str] = []
+    installed = True
+    for entry in templates:
+        template_name = entry.name
 
-        if target_file.exists() and not force:
-            console.print(f"⏭️  Skipping {template_file.name} (already exists)")
+        if template_name in existing and not force:
+            lines.append(f"⏭️  Skipping {template_name} (already exists)")
             continue
 
         try:
-            shutil.copy2(template_file, target_file)
-            console.print(f"✅ Installed: {template_file.name}")
+            _copy_file(entry.path, templates_target / template_name, entry.stat())
+            lines.append(f"✅ Installed: {template_name}")
         except Exception as e:
-            console.print(f"❌ Failed to install {template_file.name}: {e}")
-            return False
+            lines.append(f"❌ Failed to install {template_name}: {e}")
+            installed = False
+            break
 
-    return True
+    if lines:
+        console.print("\n".join(lines))
+    return installed
 
 
 def install_examples(project_dir: Path, force: bool = False) -> bool:
@@ -156,7 +511,8 @@ def install_examples(project_dir: Path, force: bool = False) -> bool:
     specs_target = project_dir / "specs" / "examples"
     specs_target.mkdir(parents=True, exist_ok=True)
 
-    examples = list(EXAMPLES_DIR.glob("*"))
+    with os.scandir(EXAMPLES_DIR) as entries:
+        examples = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
 
     if not examples:
         console.print(f"⚠️  [yellow]No examples found in: {EXAMPLES_DIR}[/yellow]")
@@ -164,27 +520,35 @@ def install_examples(project_dir: Path, force: bool = False) -> bool:
 
     console.print(f"\n📚 Installing {len(examples)} examples...")
 
-    for example_dir in examples:
-        if not example_dir.is_dir():
-            continue
-
-        target_dir = specs_target / example_dir.name
+    existing = _existing_names(specs_target)
+    _sweep_stale_copies(specs_target, existing)
+    lines: List[str] = []
+    pending = []
+    for entry in examples:
+        exists = entry.name in existing
 
-        if target_dir.exists() and not force:
-            console.print(f"⏭️  Skipping {example_dir.name} (already exists)")
+        if exists and not force:
+            lines.append(f"⏭️  Skipping {entry.name} (already exists)")
             continue
 
-        try:
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
+        pending.append((Path(entry.path), specs_target / entry.name, exists))
 
-            shutil.copytree(example_dir, target_dir)
-            console.print(f"✅ Installed: {example_dir.name}")
-        except Exception as e:
-            console.print(f"❌ Failed to install {example_dir.name}: {e}")
-            return False
+    with ThreadPoolExecutor(max_workers=max(1, min(_COPY_WORKERS, len(pending)))) as executor:
+        futures = {
+            executor.submit(_replace_tree, example_dir, target_dir, exists): example_dir.name
+            for example_dir, target_dir, exists in pending
+        }
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                for other in futures:
+                    other.cancel()
+                break
 
-    return True
+    installed = _report_copies(futures, lines.append)
+
+    if lines:
+        console.print("\n".join(lines))
+    return installed
 
 
 def update_claude_settings(claude_dir: Path) -> bool:
@@ -199,36 +563,48 @@ def update_claude_settings(claude_dir: Path) -> bool:
     """
     settings_file = claude_dir / "settings.local.json"
 
-    # Create default settings if not exists
-    if not settings_file.exists():
-        settings = {
-            "permissions": {
-                "webSearch": {"allowed": True},
-                "webFetch": {"allowed": ["*"]},
-                "bash": {"allowed": ["*"]},
-                "pythonExecutable": "python3"
-            },
-            "hooks": {
-                "userPromptSubmit": {
-                    "command": "python3",
-                    "args": ["tools/spec_prompt_hook.py"]
-                }
+    settings = {
+        "permissions": {
+            "webSearch": {"allowed": True},
+            "webFetch": {"allowed": ["*"]},
+            "bash": {"allowed": ["*"]},
+            "pythonExecutable": "python3"
+        },
+        "hooks": {
+            "userPromptSubmit": {
+                "command": "python3",
+                "args": ["tools/spec_prompt_hook.py"]
             }
         }
+    }
 
-        try:
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-            console.print(f"\n✅ Created settings file: {settings_file}")
-            return True
-        except Exception as e:
-            console.print(f"\n❌ Failed to create settings: {e}")
-            return False
+    # Encode up front so the file is written with a single call
+    if orjson is not None:
+        data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(settings, indent=2).encode('utf-8')
+
+    # Create default settings only if absent; O_EXCL makes the existence
+    # check and the create one atomic step
+    try:
+        fd = os.open(settings_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+    except FileExistsError:
+        # Settings file exists - just notify
+        console.print(f"\n💡 Settings file already exists: {settings_file}")
+        console.print("   Make sure to enable permissions and hooks as needed")
+        return True
+    except Exception as e:
+        console.print(f"\n❌ Failed to create settings: {e}")
+        return False
 
-    # Settings file exists - just notify
-    console.print(f"\n💡 Settings file already exists: {settings_file}")
-    console.print("   Make sure to enable permissions and hooks as needed")
-    return True
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        console.print(f"\n✅ Created settings file: {settings_file}")
+        return True
+    except Exception as e:
+        console.print(f"\n❌ Failed to create settings: {e}")
+        return False
 
 
 def install_to_project(
@@ -275,99 +651,68 @@ def install_to_project(
     tools_target = project_dir / "tools"
     tools_target.mkdir(parents=True, exist_ok=True)
 
-    # Copy spec_prompt_hook.py for the hook
-    hook_script = Path(__file__).parent / "spec_prompt_hook.py"
-    if hook_script.exists():
-        try:
-            shutil.copy2(hook_script, tools_target / "spec_prompt_hook.py")
-            console.print(f"\n✅ Installed hook script to: {tools_target}")
-        except Exception as e:
-            console.print(f"\n⚠️  [yellow]Failed to install hook script: {e}[/yellow]")
+    # Copy spec_prompt_hook.py for the hook; the stat doubles as the
+    # existence check and the source of the copied metadata
+    try:
+        _copy_file(_HOOK_SCRIPT, tools_target / _HOOK_SCRIPT.name, os.stat(_HOOK_SCRIPT))
+        console.print(f"\n✅ Installed hook script to: {tools_target}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        console.print(f"\n⚠️  [yellow]Failed to install hook script: {e}[/yellow]")
 
     return True
 
 
-def list_skills() -> List[Dict[str, str]]:
+def count_skills(skills_dir: Optional[Path] = None) -> int:
+    """
+    Count skill directories without reading any skill metadata.
+
+    Hidden directories, such as an interrupted install's staging copies,
+    are not counted.
+
+    Args:
+        skills_dir: Directory to count (defaults to the bundled skills)
+
+    Returns:
+        Number of skill directories
+    """
+    with os.scandir(skills_dir or SKILLS_DIR) as entries:
+        return sum(1 for entry in entries if not entry.name.startswith(".") and entry.is_dir())
+
+
+@functools.lru_cache(maxsize=1)
+def list_skills() -> Tuple[Skill, ...]:
     """
     List all available AIDK skills with metadata.
 
+    The result is cached for the life of the process; call
+    list_skills.cache_clear() after the skills directory changes.
+
+    Installed packages ship an index written at build time (see setup.py)
+    so no skill files need to be opened. The skills directory is scanned
+    instead when the index is missing, malformed, or out of date with it.
+
     Returns:
-        List of skill dictionaries with name, description, category
-    """
-    skills = []
-
-    # Define skill categories
-    categories = {
-        "android-project-setup": "Core Architecture",
-        "android-clean-architecture": "Core Architecture",
-        "android-mvvm-architecture": "Core Architecture",
-        "android-compose-ui": "UI Development",
-        "android-compose-navigation": "UI Development",
-        "android-compose-theming": "UI Development",
-        "android-xml-views": "UI Development",
-        "android-hilt-di": "Dependency Injection",
-        "android-koin-di": "Dependency Injection",
-        "android-repository-pattern": "Data Layer",
-        "android-database-room": "Data Layer",
-        "android-networking-retrofit": "Data Layer",
-        "android-datastore": "Data Layer",
-        "android-json-moshi": "JSON Parsing",
-        "android-json-kotlinx": "JSON Parsing",
-        "android-stateflow": "State Management",
-        "android-one-time-events": "State Management",
-        "android-coroutines": "Async & Background",
-        "android-workmanager": "Async & Background",
-        "android-paging3": "Async & Background",
-        "android-compose-testing": "Testing",
-        "android-unit-testing": "Testing",
-        "android-testing-mockk": "Testing",
-        "android-testing-turbine": "Testing",
-        "android-gradle-config": "Build Configuration",
-        "android-permissions": "Common Features",
-        "android-image-loading": "Common Features",
-        "android-forms-validation": "Common Features",
-        "android-list-ui": "Common Features",
-        "android-material-components": "Common Features",
-        "android-logging-timber": "Utilities",
-        "android-animation-lottie": "Animation",
-        "android-git-atomic-commits": "Git Workflow",
-        "android-git-spec-workflow": "Git Workflow",
-        "android-git-conventional-commits": "Git Workflow",
-        "android-git-multi-commit-feature": "Git Workflow",
-    }
+        Skill records with name, description, category, sorted by name
+    """
+    index = _load_skill_index()
+    if index is not None:
+        return index
 
-    skill_dirs = sorted(SKILLS_DIR.glob("android-*"))
+    return tuple(read_skills(SKILLS_DIR))
 
-    for skill_dir in skill_dirs:
-        if not skill_dir.is_dir():
-            continue
 
-        skill_name = skill_dir.name
-        category = categories.get(skill_name, "Other")
-
-        # Try to read description from skill.md
-        skill_file = skill_dir / "skill.md"
-        description = "Android development skill"
-
-        if skill_file.exists():
-            try:
-                content = skill_file.read_text()
-                # Extract first line or title
-                lines = content.strip().split('\n')
-                for line in lines:
-                    if line.strip() and not line.startswith('#'):
-                        description = line.strip()
-                        break
-            except Exception:
-                pass
-
-        skills.append({
-            "name": skill_name,
-            "description": description,
-            "category": category
-        })
-
-    return skills
+def _load_skill_index() -> Optional[Tuple[Skill, ...]]:
+    """Skill records from the packaged index, or None if it is unusable."""
+    try:
+        data = pkgutil.get_data("aidk", SKILL_INDEX_NAME)
+    except OSError:
+        return None
+    if data is None:
+        return None
+
+    return load_index(data, SKILLS_DIR)
 
 
 def main():
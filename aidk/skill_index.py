@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+AIDK Skill Index
+
+Reads skill metadata for list_skills() and builds the prebuilt index that
+packaged installs load instead of opening every skill.md. Uses only the
+standard library so setup.py can write the index during the build.
+"""
+
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator, List, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prebuilt list_skills() data, written into the package at build time
+SKILL_INDEX_NAME = "_skill_index.json"
+# Bump when the index layout changes so older indexes are rebuilt, not misread
+_INDEX_FORMAT = 2
+# Skill file whose size and mtime stand in for its contents in the index
+_SKILL_FILE = "SKILL.md"
+
+# Category shown by list_skills() for each bundled skill
+# Keys and values are interned so lookups by an interned skill name can
+# short-circuit on identity, and Skill records share the category strings.
+SKILL_CATEGORIES: Mapping[str, str] = MappingProxyType({
+    sys.intern(name): sys.intern(category) for name, category in {
+        "android-project-setup": "Core Architecture",
+        "android-clean-architecture": "Core Architecture",
+        "android-mvvm-architecture": "Core Architecture",
+        "android-compose-ui": "UI Development",
+        "android-compose-navigation": "UI Development",
+        "android-compose-theming": "UI Development",
+        "android-xml-views": "UI Development",
+        "android-hilt-di": "Dependency Injection",
+        "android-koin-di": "Dependency Injection",
+        "android-repository-pattern": "Data Layer",
+        "android-database-room": "Data Layer",
+        "android-networking-retrofit": "Data Layer",
+        "android-datastore": "Data Layer",
+        "android-json-moshi": "JSON Parsing",
+        "android-json-kotlinx": "JSON Parsing",
+        "android-stateflow": "State Management",
+        "android-one-time-events": "State Management",
+        "android-coroutines": "Async & Background",
+        "android-workmanager": "Async & Background",
+        "android-paging3": "Async & Background",
+        "android-compose-testing": "Testing",
+        "android-unit-testing": "Testing",
+        "android-testing-mockk": "Testing",
+        "android-testing-turbine": "Testing",
+        "android-gradle-config": "Build Configuration",
+        "android-permissions": "Common Features",
+        "android-image-loading": "Common Features",
+        "android-forms-validation": "Common Features",
+        "android-list-ui": "Common Features",
+        "android-material-components": "Common Features",
+        "android-logging-timber": "Utilities",
+        "android-animation-lottie": "Animation",
+        "android-git-atomic-commits": "Git Workflow",
+        "android-git-spec-workflow": "Git Workflow",
+        "android-git-conventional-commits": "Git Workflow",
+        "android-git-multi-commit-feature": "Git Workflow",
+    }.items()
+})
+OTHER_CATEGORY = "Other"
+
+
+@dataclass(frozen=True)
+class Skill:
+    """Metadata for one bundled skill."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("name", "description", "category")
+
+    name: str
+    description: str
+    category: str
+
+
+def iter_skill_dirs(skills_dir: Union[str, Path]) -> List[os.DirEntry]:
+    """
+    List the skill directories, sorted by name.
+
+    Args:
+        skills_dir: Directory holding the android-* skill directories
+
+    Returns:
+        DirEntry objects for every android-* directory in skills_dir
+    """
+    with os.scandir(skills_dir) as entries:
+        return sorted(
+            (entry for entry in entries if entry.name.startswith("android-") and entry.is_dir()),
+            key=lambda entry: entry.name
+        )
+
+
+def read_skills(skills_dir: Union[str, Path]) -> Iterator[Skill]:
+    """Read each skill's metadata from its directory."""
+    for entry in iter_skill_dirs(skills_dir):
+        skill_name = sys.intern(entry.name)
+        category = SKILL_CATEGORIES.get(skill_name, OTHER_CATEGORY)
+
+        # Try to read description from skill.md
+        skill_file = Path(entry.path) / "skill.md"
+        description = "Android development skill"
+
+        if skill_file.exists():
+            try:
+                # First non-heading line; stop reading once it is found
+                with skill_file.open('r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line and not line.startswith('#'):
+                            description = line
+                            break
+            except Exception:
+                pass
+
+        yield Skill(name=skill_name, description=description, category=category)
+
+
+def _signature(skills_dir: Union[str, Path], mtimes: bool = True) -> List[list]:
+    """
+    Fingerprint the skills directory without opening any skill files.
+
+    Each skill contributes its name and the size and mtime (in ns) of its
+    SKILL.md; both are -1 when the file is absent.
+
+    Args:
+        skills_dir: Directory holding the android-* skill directories
+        mtimes: Record mtimes; None is stored instead when False
+    """
+    signature = []
+    for entry in iter_skill_dirs(skills_dir):
+        try:
+            st = os.stat(os.path.join(entry.path, _SKILL_FILE))
+            size, mtime = st.st_size, st.st_mtime_ns
+        except OSError:
+            size = mtime = -1
+        signature.append([entry.name, size, mtime if mtimes else None])
+    return signature
+
+
+def _signature_matches(recorded: List[list], skills_dir: Union[str, Path]) -> bool:
+    """Whether a recorded signature still describes skills_dir."""
+    current = _signature(skills_dir)
+    if len(recorded) != len(current):
+        return False
+    for (name, size, mtime), (cur_name, cur_size, cur_mtime) in zip(recorded, current):
+        if name != cur_name or size != cur_size:
+            return False
+        if mtime is not None and mtime != cur_mtime:
+            return False
+    return True
+
+
+def build_index(skills_dir: Union[str, Path], mtimes: bool = True) -> bytes:
+    """
+    Build the index list_skills() loads in place of a directory scan.
+
+    Args:
+        skills_dir: Directory holding the android-* skill directories
+        mtimes: Also check SKILL.md mtimes when loading. Pass False for
+            indexes shipped in wheels: installers do not keep file mtimes,
+            so only names and sizes carry over to the installed copy.
+
+    Returns:
+        UTF-8 JSON with the skill records and the directory signature
+    """
+    index = {
+        "format": _INDEX_FORMAT,
+        "signature": _signature(skills_dir, mtimes),
+        "skills": [
+            {"name": skill.name, "description": skill.description, "category": skill.category}
+            for skill in read_skills(skills_dir)
+        ],
+    }
+    return json.dumps(index, ensure_ascii=False).encode("utf-8")
+
+
+def load_index(data: bytes, skills_dir: Union[str, Path]) -> Optional[Tuple[Skill, ...]]:
+    """
+    Skill records from an index built by build_index().
+
+    Args:
+        data: Raw index contents
+        skills_dir: Directory the index must still describe
+
+    Returns:
+        Skill records, or None if the index is malformed or no longer
+        matches skills_dir; callers then scan the directory instead
+    """
+    try:
+        index = orjson.loads(data) if orjson is not None else json.loads(data)
+        if index["format"] != _INDEX_FORMAT:
+            return None
+        if not _signature_matches(index["signature"], skills_dir):
+            return None
+        return tuple(
+            Skill(
+                name=sys.intern(record["name"]),
+                description=record["description"],
+                category=sys.intern(record["category"]),
+            )
+            for record in index["skills"]
+        )
+    except (ValueError, TypeError, KeyError, OSError):
+        return None
@@ -14,6 +14,35 @@ import json
 import re
 
 
+# Keywords that suggest feature implementation
+_TRIGGER_PATTERNS = [
+    # English patterns. Any of these verbs triggers on its own; "make"
+    # only before a feature noun
+    r'\b(implement|create|build|add|develop)\b',
+    r'\bmake\b.{0,200}\b(feature|screen|page|component|function)',
+    r'\bnew\s+(feature|screen|page|component)',
+
+    # Korean patterns
+    r'(구현|개발|만들|생성|추가).{0,200}\b(기능|화면|페이지|컴포넌트|함수)',
+    r'(구현|개발|만들|생성|추가)\s*(해|하)',
+    r'새\s*(기능|화면|페이지|컴포넌트)',
+]
+
+# All patterns as one alternation, compiled once at import: a prompt is
+# scanned in a single search instead of one per pattern
+_TRIGGER_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _TRIGGER_PATTERNS), re.IGNORECASE)
+
+# Every English pattern needs one of these words; an ASCII prompt (which
+# cannot hold the Korean patterns) without any of them is rejected with
+# substring checks before the regex runs
+_TRIGGER_WORDS = ('implement', 'create', 'build', 'add', 'develop', 'make', 'new')
+
+
+# Hook response with the context left to fill in; laid out as json.dumps
+# would write the full dict
+_OUTPUT_TEMPLATE = '{"hookSpecificOutput": {"hookEventName": "UserPromptSubmit", "additionalContext": %s}}\n'
+
+
 def should_trigger_spec_reminder(prompt: str) -> bool:
     """
     Check if the user prompt suggests starting new feature implementation work.
@@ -24,26 +53,12 @@ def should_trigger_spec_reminder(prompt: str) -> bool:
     Returns:
         True if SPEC-First reminder should be shown
     """
-    # Keywords that suggest feature implementation
-    trigger_patterns = [
-        # English patterns
-        r'\b(implement|create|build|add|develop|make)\b.*\b(feature|screen|page|component|function)',
-        r'\b(implement|create|build|add|develop)\b',
-        r'\bnew\s+(feature|screen|page|component)',
-
-        # Korean patterns
-        r'(구현|개발|만들|생성|추가).*\b(기능|화면|페이지|컴포넌트|함수)',
-        r'(구현|개발|만들|생성|추가)\s*(해|하)',
-        r'새\s*(기능|화면|페이지|컴포넌트)',
-    ]
-
-    prompt_lower = prompt.lower()
+    if prompt.isascii():
+        prompt_lower = prompt.lower()
+        if not any(word in prompt_lower for word in _TRIGGER_WORDS):
+            return False
 
-    for pattern in trigger_patterns:
-        if re.search(pattern, prompt_lower, re.IGNORECASE):
-            return True
-
-    return False
+    return _TRIGGER_RE.search(prompt) is not None
 
 
 def generate_spec_first_context() -> str:
@@ -119,15 +134,10 @@ def main():
             # Generate context
             context = generate_spec_first_context()
 
-            # Output in Claude Code hook format
-            output = {
-                "hookSpecificOutput": {
-                    "hookEventName": "UserPromptSubmit",
-                    "additionalContext": context
-                }
-            }
-
-            print(json.dumps(output))
+            # Output in Claude Code hook format, as bytes in one write; only
+            # the context needs JSON encoding
+            output = _OUTPUT_TEMPLATE % json.dumps(context)
+            sys.stdout.buffer.write(output.encode('ascii'))
             sys.exit(0)
         else:
             # No additional context needed
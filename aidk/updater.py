@@ -6,22 +6,28 @@ Handles version checking and automatic updates for AIDK.
 Uses GitHub releases API to check for new versions.
 """
 
+import argparse
+import importlib.util
 import json
+import os
 import subprocess
 import sys
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
+from typing import Optional, Tuple
 
 try:
-    import requests
+    import orjson
 except ImportError:
-    requests = None
+    orjson = None
 
 from aidk import __version__
 
-console = Console()
+# rich and requests are imported on first use: the CLI's startup check
+# usually answers from the cache and needs neither
+_console_instance = None
+_requests_module = None
 
 # GitHub repository information
 GITHUB_REPO = "yourusername/android-ai-devkit"
@@ -31,53 +37,253 @@ GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 CACHE_FILE = Path.home() / ".aidk" / "update_cache.json"
 CACHE_DURATION = timedelta(hours=24)
 
+# TTL bounds when it is derived from the cached release's age: a fresh
+# release may be followed by a quick fix, an old one rarely changes soon
+CACHE_MIN_DURATION = timedelta(hours=1)
+CACHE_MAX_DURATION = timedelta(days=7)
 
-def get_cache() -> Optional[dict]:
+# The same durations in seconds: cache entries hold epoch timestamps, so
+# the validity check on every CLI invocation is plain float arithmetic
+_CACHE_SECONDS = CACHE_DURATION.total_seconds()
+_CACHE_MIN_SECONDS = CACHE_MIN_DURATION.total_seconds()
+_CACHE_MAX_SECONDS = CACHE_MAX_DURATION.total_seconds()
+
+# Minimum spacing between background refreshes, so an unreachable or
+# failing GitHub is not retried by every CLI invocation
+_REFRESH_BACKOFF_SECONDS = CACHE_MIN_DURATION.total_seconds()
+
+
+def _console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
+
+
+def _requests():
+    """Return the requests module, importing it on first use.
+
+    Returns:
+        The module, or None if requests is not installed
     """
-    Get cached update check data.
+    global _requests_module
+    if _requests_module is None:
+        try:
+            import requests
+        except ImportError:
+            requests = False
+        _requests_module = requests
+    return _requests_module or None
+
+
+# Release fields kept in the cache so the changelog needs no second request
+_RELEASE_FIELDS = ('tag_name', 'name', 'body', 'published_at', 'html_url')
+
+
+def _read_cache() -> Optional[dict]:
+    """
+    Read the cache file regardless of its age.
 
     Returns:
-        Cached data dict, or None if cache is invalid/expired
+        Cached data dict, or None if missing or unreadable
     """
-    if not CACHE_FILE.exists():
+    try:
+        data = CACHE_FILE.read_bytes()
+    except OSError:
+        # Missing or unreadable - treat as a cache miss
         return None
 
     try:
-        with open(CACHE_FILE, 'r') as f:
-            cache = json.load(f)
+        cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        # Corrupt or hand-edited cache file - treat as a cache miss
+        return None
 
-        # Check if cache is still valid
-        cached_time = datetime.fromisoformat(cache.get('timestamp', ''))
-        if datetime.now() - cached_time > CACHE_DURATION:
-            return None
+    return cache if isinstance(cache, dict) else None
 
-        return cache
 
-    except (json.JSONDecodeError, ValueError, KeyError):
+def _published_timestamp(release: dict) -> Optional[float]:
+    """
+    Convert a release's published_at to epoch seconds.
+
+    Args:
+        release: Release payload from GitHub
+
+    Returns:
+        Epoch seconds, or None if the date is missing or malformed
+    """
+    try:
+        # GitHub uses a 'Z' suffix, which fromisoformat() rejects before 3.11
+        published = datetime.fromisoformat(release.get('published_at', '').replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
         return None
 
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
 
-def set_cache(latest_version: str):
+
+def _cache_duration(cache: dict) -> float:
+    """
+    Get how long a cache entry stays valid.
+
+    The TTL is a quarter of the cached release's age, clamped to
+    CACHE_MIN_DURATION..CACHE_MAX_DURATION; entries without a release
+    date use CACHE_DURATION.
+
+    Args:
+        cache: Cached data dict
+
+    Returns:
+        Cache lifetime in seconds
+    """
+    published = cache.get('published')
+    if not isinstance(published, (int, float)):
+        return _CACHE_SECONDS
+
+    release_age = time.time() - published
+    return min(max(release_age / 4, _CACHE_MIN_SECONDS), _CACHE_MAX_SECONDS)
+
+
+def get_cache() -> Optional[dict]:
+    """
+    Get cached update check data.
+
+    Returns:
+        Cached data dict, or None if cache is invalid/expired
+    """
+    cache = _read_cache()
+    if cache is None:
+        return None
+
+    # Check if cache is still valid. Caches from older versions hold an ISO
+    # timestamp string and count as expired
+    cached_time = cache.get('timestamp')
+    if not isinstance(cached_time, (int, float)):
+        return None
+    if time.time() - cached_time > _cache_duration(cache):
+        return None
+
+    return cache
+
+
+def set_cache(latest_version: str, release: Optional[dict] = None, etag: Optional[str] = None) -> dict:
     """
     Save update check data to cache.
 
     Args:
         latest_version: Latest version string
-    """
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        release: Release payload from GitHub, stored for show_changelog
+        etag: ETag of the release response, sent back as If-None-Match
 
+    Returns:
+        The cache data, even if it could not be written
+    """
     cache_data = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': time.time(),
         'latest_version': latest_version,
         'current_version': __version__
     }
+    if etag:
+        cache_data['etag'] = etag
+    if release:
+        cache_data['release'] = {field: release.get(field, '') for field in _RELEASE_FIELDS}
+        published = _published_timestamp(release)
+        if published is not None:
+            cache_data['published'] = published
+
+    _write_cache(cache_data)
+    return cache_data
+
+
+def _write_cache(cache_data: dict):
+    """
+    Write cache data to CACHE_FILE, ignoring write errors.
+
+    Args:
+        cache_data: Cache dict to store
+    """
+    # Write beside the cache and rename into place, so a reader never sees
+    # a half-written file from a background refresh
+    if orjson is not None:
+        data = orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(cache_data, indent=2).encode('utf-8')
 
+    tmp_file = CACHE_FILE.with_name(f".{CACHE_FILE.name}.{os.getpid()}.tmp")
     try:
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, CACHE_FILE)
     except Exception as e:
         # Silently fail on cache write errors
-        pass
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def _fetch_release(etag: Optional[str] = None) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Fetch the latest release from GitHub, conditionally on a cached ETag.
+
+    A 304 reply (release unchanged) does not count against the API rate
+    limit and carries no body.
+
+    Args:
+        etag: ETag from a previous response, if any
+
+    Returns:
+        (release data, etag); release data is None on 304
+
+    Raises:
+        requests.exceptions.RequestException: On network or HTTP errors
+        ValueError: If the response body is not valid JSON
+    """
+    headers = {'If-None-Match': etag} if etag else {}
+    response = _requests().get(GITHUB_API_URL, headers=headers, timeout=5)
+
+    if response.status_code == 304:
+        return None, etag
+
+    response.raise_for_status()
+    return response.json(), response.headers.get('ETag')
+
+
+def _refresh_release() -> Optional[dict]:
+    """
+    Bring the cache up to date with GitHub and return it.
+
+    An expired cache is revalidated with its ETag rather than refetched.
+
+    Returns:
+        Fresh cache dict, or None if GitHub could not be reached
+    """
+    requests = _requests()
+    if requests is None:
+        # requests not available, skip update check
+        return None
+
+    stale = _read_cache() or {}
+    etag = stale.get('etag') if isinstance(stale.get('release'), dict) else None
+
+    try:
+        data, etag = _fetch_release(etag)
+    except (requests.exceptions.RequestException, ValueError):
+        # Network error or invalid response - silently fail
+        return None
+
+    if data is None:
+        # 304: the cached release is still the latest one
+        data = stale['release']
+
+    latest_version = data.get('tag_name', '').lstrip('v')
+    if not latest_version:
+        return None
+
+    return set_cache(latest_version, release=data, etag=etag)
 
 
 def parse_version(version: str) -> tuple:
@@ -100,12 +306,52 @@ def parse_version(version: str) -> tuple:
         return (0, 0, 0)
 
 
+def _spawn_cache_refresh():
+    """
+    Refresh the update cache in a detached background process.
+
+    The foreground command does not wait for GitHub; the next invocation
+    reads the warmed cache. The attempt is recorded in the cache first, and
+    no new refresh starts within _REFRESH_BACKOFF_SECONDS of the last one,
+    whether or not it succeeded.
+    """
+    stale = _read_cache() or {}
+    last_attempt = stale.get('refresh_attempt')
+    now = time.time()
+    if isinstance(last_attempt, (int, float)) and 0 <= now - last_attempt < _REFRESH_BACKOFF_SECONDS:
+        return
+
+    # Keep the stale entry (ETag, release) for the refresher to revalidate
+    stale['refresh_attempt'] = now
+    _write_cache(stale)
+
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "aidk.updater", "--refresh-cache"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs
+        )
+    except OSError:
+        # Could not start the refresher - check again next time
+        pass
+
+
 def check_for_updates(silent: bool = False) -> Optional[str]:
     """
     Check for available updates.
 
     Args:
-        silent: If True, don't print any messages (use cache only)
+        silent: If True, don't print any messages (use cache only; a
+            missing or expired cache is refreshed in the background)
 
     Returns:
         Latest version string if available, None otherwise
@@ -118,66 +364,57 @@ def check_for_updates(silent: bool = False) -> Optional[str]:
             current = parse_version(__version__)
             latest = parse_version(latest_version)
             if latest > current:
-                console.print(
+                _console().print(
                     f"💡 [dim]New version available: {latest_version} "
                     f"(current: {__version__}). Run 'aidk update' to upgrade.[/dim]"
                 )
         return latest_version
 
-    # No cache or expired - check GitHub if not silent
+    # No cache or expired - refresh in the background if silent, otherwise
+    # check GitHub now. The background refresh needs requests, which is
+    # looked up without importing it
     if silent:
+        if importlib.util.find_spec('requests') is not None:
+            _spawn_cache_refresh()
         return None
 
-    if requests is None:
-        # requests not available, skip update check
+    cache = _refresh_release()
+    if not cache:
         return None
 
-    try:
-        response = requests.get(GITHUB_API_URL, timeout=5)
-        response.raise_for_status()
+    latest_version = cache['latest_version']
 
-        data = response.json()
-        latest_version = data.get('tag_name', '').lstrip('v')
-
-        if latest_version:
-            # Update cache
-            set_cache(latest_version)
-
-            # Compare versions
-            current = parse_version(__version__)
-            latest = parse_version(latest_version)
+    # Compare versions
+    current = parse_version(__version__)
+    latest = parse_version(latest_version)
 
-            if latest > current:
-                return latest_version
-            else:
-                return __version__
-
-    except requests.exceptions.RequestException:
-        # Network error - silently fail
-        return None
-    except (json.JSONDecodeError, KeyError):
-        # Invalid response - silently fail
-        return None
+    if latest > current:
+        return latest_version
+    else:
+        return __version__
 
 
 def perform_update():
     """
     Perform automatic update using pip.
     """
-    console.print("\n🔄 [cyan]Updating Android AI Development Kit...[/cyan]")
+    _console().print("\n🔄 [cyan]Updating Android AI Development Kit...[/cyan]")
 
     try:
-        # Try to update from PyPI
+        # Try to update from PyPI. Quiet output keeps the captured buffers
+        # small, and pip's own self-update check would be a second network
+        # round-trip for nothing
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "--upgrade", "android-ai-devkit"],
+            [sys.executable, "-m", "pip", "install", "--upgrade", "--quiet",
+             "--disable-pip-version-check", "android-ai-devkit"],
             capture_output=True,
             text=True,
             timeout=60
         )
 
         if result.returncode == 0:
-            console.print("✅ [green]Update completed successfully![/green]")
-            console.print("\n💡 Changes will take effect on next run.")
+            _console().print("✅ [green]Update completed successfully![/green]")
+            _console().print("\n💡 Changes will take effect on next run.")
 
             # Clear cache
             if CACHE_FILE.exists():
@@ -185,46 +422,54 @@ def perform_update():
 
             return True
         else:
-            console.print("❌ [red]Update failed:[/red]")
-            console.print(result.stderr)
+            _console().print("❌ [red]Update failed:[/red]")
+            _console().print(result.stderr)
             return False
 
     except subprocess.TimeoutExpired:
-        console.print("❌ [red]Update timed out. Please try again.[/red]")
+        _console().print("❌ [red]Update timed out. Please try again.[/red]")
         return False
     except Exception as e:
-        console.print(f"❌ [red]Update failed: {e}[/red]")
-        console.print("\n💡 Try updating manually:")
-        console.print("   [cyan]pip install --upgrade android-ai-devkit[/cyan]")
+        _console().print(f"❌ [red]Update failed: {e}[/red]")
+        _console().print("\n💡 Try updating manually:")
+        _console().print("   [cyan]pip install --upgrade android-ai-devkit[/cyan]")
         return False
 
 
-def get_latest_version_info() -> Optional[dict]:
+def get_cached_release() -> Optional[dict]:
     """
-    Get detailed information about the latest release.
+    Get the release payload stored by the last update check.
 
     Returns:
-        Release information dict, or None if unavailable
+        Raw release fields, or None if the cache is missing or expired
     """
-    if requests is None:
-        return None
-
-    try:
-        response = requests.get(GITHUB_API_URL, timeout=5)
-        response.raise_for_status()
+    cache = get_cache()
+    release = cache.get('release') if cache else None
+    return release if isinstance(release, dict) else None
 
-        data = response.json()
 
-        return {
-            'version': data.get('tag_name', '').lstrip('v'),
-            'name': data.get('name', ''),
-            'body': data.get('body', ''),
-            'published_at': data.get('published_at', ''),
-            'html_url': data.get('html_url', ''),
-        }
+def get_latest_version_info() -> Optional[dict]:
+    """
+    Get detailed information about the latest release.
 
-    except (requests.exceptions.RequestException, json.JSONDecodeError, KeyError):
-        return None
+    Returns:
+        Release information dict, or None if unavailable
+    """
+    # Reuse the release fetched by check_for_updates when it is cached
+    data = get_cached_release()
+    if data is None:
+        cache = _refresh_release()
+        if not cache:
+            return None
+        data = cache['release']
+
+    return {
+        'version': data.get('tag_name', '').lstrip('v'),
+        'name': data.get('name', ''),
+        'body': data.get('body', ''),
+        'published_at': data.get('published_at', ''),
+        'html_url': data.get('html_url', ''),
+    }
 
 
 def show_changelog(from_version: str, to_version: str):
@@ -238,43 +483,52 @@ def show_changelog(from_version: str, to_version: str):
     release_info = get_latest_version_info()
 
     if not release_info:
-        console.print("⚠️  [yellow]Could not fetch changelog[/yellow]")
+        _console().print("⚠️  [yellow]Could not fetch changelog[/yellow]")
         return
 
-    console.print(f"\n📋 [bold cyan]Changelog ({from_version} → {to_version})[/bold cyan]")
-    console.print("─" * 60)
+    _console().print(f"\n📋 [bold cyan]Changelog ({from_version} → {to_version})[/bold cyan]")
+    _console().print("─" * 60)
 
     # Display release notes
     body = release_info.get('body', 'No changelog available.')
-    console.print(body)
+    _console().print(body)
 
-    console.print("─" * 60)
+    _console().print("─" * 60)
 
     # Display release URL
     html_url = release_info.get('html_url')
     if html_url:
-        console.print(f"\n🔗 Full release notes: {html_url}")
+        _console().print(f"\n🔗 Full release notes: {html_url}")
 
 
 def main():
-    """Test updater functionality."""
-    console.print(f"Current version: {__version__}")
+    """Test updater functionality, or refresh the cache with --refresh-cache."""
+    parser = argparse.ArgumentParser(description="AIDK update checker")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Fetch the latest release into the cache and exit")
+    args = parser.parse_args()
+
+    if args.refresh_cache:
+        _refresh_release()
+        return
+
+    _console().print(f"Current version: {__version__}")
 
     latest = check_for_updates(silent=False)
 
     if latest:
-        console.print(f"Latest version: {latest}")
+        _console().print(f"Latest version: {latest}")
 
         if parse_version(latest) > parse_version(__version__):
-            console.print("\n✨ Update available!")
+            _console().print("\n✨ Update available!")
             show_changelog(__version__, latest)
 
             if input("\nUpdate now? [y/N]: ").lower() == 'y':
                 perform_update()
         else:
-            console.print("\n✅ You're up to date!")
+            _console().print("\n✅ You're up to date!")
     else:
-        console.print("\n⚠️  Could not check for updates")
+        _console().print("\n⚠️  Could not check for updates")
 
 
 if __name__ == '__main__':
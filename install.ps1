@@ -116,6 +116,10 @@ function Install-AIDK {
             Write-ColorMessage "❌ Installation failed!" -Color Red
             exit 1
         }
+
+        # Editable installs are not byte-compiled by pip; do it once here
+        # so the first `aidk` run loads from __pycache__.
+        & $PythonCmd -m compileall -q aidk | Out-Null
     } else {
         # Install from PyPI
         Write-ColorMessage "Installing from PyPI..." -Color Yellow
@@ -85,6 +85,9 @@ install_aidk() {
             print_message "$RED" "❌ Installation failed!"
             exit 1
         }
+        # Editable installs are not byte-compiled by pip; do it once here
+        # so the first `aidk` run loads from __pycache__.
+        $PYTHON_CMD -m compileall -q aidk || true
     else
         # Install from PyPI
         print_message "$YELLOW" "Installing from PyPI..."
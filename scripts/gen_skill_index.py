@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Generate the packaged skill index
+
+Builds run this automatically (see the build_py command in setup.py); the
+script writes the same index into the source tree, so list_skills() can
+be checked against it without building a wheel. list_skills() ignores the
+file and scans the skills directory once the skills no longer match it.
+
+Usage:
+    python scripts/gen_skill_index.py
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from aidk.skill_index import SKILL_INDEX_NAME, build_index  # noqa: E402
+
+
+def main():
+    """Write the skill index next to the aidk package modules."""
+    skills_dir = REPO_ROOT / "aidk" / "data" / "skills"
+    index_file = REPO_ROOT / "aidk" / SKILL_INDEX_NAME
+    index_file.write_bytes(build_index(skills_dir))
+    print(f"Wrote skill index for {skills_dir} to {index_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,9 +3,16 @@ Setup script for Android AI Development Kit
 Provides backward compatibility for older pip versions
 """
 
-from setuptools import setup, find_packages
+import sys
 from pathlib import Path
 
+from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+# aidk.skill_index is stdlib-only, so it imports without the runtime deps
+sys.path.insert(0, str(Path(__file__).parent))
+from aidk.skill_index import SKILL_INDEX_NAME, build_index  # noqa: E402
+
 # Read version from VERSION file
 version_file = Path(__file__).parent / "VERSION"
 version = version_file.read_text().strip()
@@ -14,6 +21,19 @@ version = version_file.read_text().strip()
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8")
 
+
+class BuildPyWithSkillIndex(build_py):
+    """build_py that also writes the list_skills() index into the package."""
+
+    def run(self):
+        super().run()
+        skills_dir = Path(__file__).parent / "aidk" / "data" / "skills"
+        index_file = Path(self.build_lib) / "aidk" / SKILL_INDEX_NAME
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        # Installers reset file mtimes, so the shipped index checks sizes only
+        index_file.write_bytes(build_index(skills_dir, mtimes=False))
+
+
 setup(
     name="android-ai-devkit",
     version=version,
@@ -32,6 +52,7 @@ setup(
         ],
     },
     include_package_data=True,
+    cmdclass={"build_py": BuildPyWithSkillIndex},
     install_requires=[
         "pyyaml>=6.0.1",
         "markdown>=3.5.1",
@@ -13,10 +13,18 @@ Usage:
 import argparse
 import os
 import re
+import string
 import sys
-from datetime import datetime
+import time
+from collections import Counter
+from enum import IntEnum
+from itertools import chain, compress
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Leading bytes of a SPEC.md searched for its spec_id
+_SPEC_HEAD_BYTES = 4096
+
 
 # ANSI color codes for terminal output
 class Colors:
@@ -31,6 +39,39 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Plain output when piped or when NO_COLOR is set
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR') is not None:
+    for _name in [n for n in vars(Colors) if n.isupper()]:
+        setattr(Colors, _name, '')
+
+
+def _prompt_reader():
+    """Return an input()-compatible reader for the interactive prompts.
+
+    A terminal keeps using input(). Piped stdin (scripts, CI) is read in a
+    single call and answers are handed out line by line, with the prompt
+    still echoed and EOFError raised once the lines run out, as input() does.
+    """
+    if sys.stdin.isatty():
+        return input
+
+    lines = iter(sys.stdin.read().splitlines())
+
+    def read_line(prompt: str = "") -> str:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = next(lines, None)
+        if line is None:
+            raise EOFError("EOF when reading a line")
+        return line
+
+    return read_line
+
+
+# Skills every SPEC lists, after the keyword matches
+_CORE_SKILLS = ("android-clean-architecture", "android-mvvm-architecture", "android-compose-ui")
+
+
 class AndroidSkillMatcher:
     """Matches feature descriptions to relevant Android skills."""
 
@@ -245,6 +286,30 @@ class AndroidSkillMatcher:
         },
     }
 
+    # Flattened view of SKILLS, built on first use: distinct keywords and,
+    # in a parallel tuple, the indices into _SKILL_NAMES of the skills
+    # listing each keyword
+    _SKILL_NAMES: Tuple[str, ...] = ()
+    _KEYWORDS: Tuple[str, ...] = ()
+    _KEYWORD_SKILL_IDS: Tuple[Tuple[int, ...], ...] = ()
+
+    @classmethod
+    def _build_keyword_index(cls) -> None:
+        """Invert SKILLS into the parallel keyword / skill-index tuples.
+
+        Keywords shared by several skills ("test", "git", "json", ...) are
+        then searched for once per call instead of once per skill.
+        """
+        names = tuple(cls.SKILLS)
+        index: Dict[str, List[int]] = {}
+        for skill_idx, skill_name in enumerate(names):
+            for keyword in cls.SKILLS[skill_name]["keywords"]:
+                index.setdefault(keyword, []).append(skill_idx)
+
+        cls._SKILL_NAMES = names
+        cls._KEYWORDS = tuple(index)
+        cls._KEYWORD_SKILL_IDS = tuple(tuple(ids) for ids in index.values())
+
     def match_skills(self, feature_description: str, requirements: List[str]) -> List[str]:
         """Match skills based on feature description and requirements.
 
@@ -257,34 +322,77 @@ class AndroidSkillMatcher:
         """
         text = f"{feature_description} {' '.join(requirements)}".lower()
 
-        matched_skills = []
-        for skill_name, skill_data in self.SKILLS.items():
-            score = 0
-            for keyword in skill_data["keywords"]:
-                if keyword in text:
-                    score += 1
+        if not self._KEYWORDS:
+            self._build_keyword_index()
+
+        # One substring test per distinct keyword; the hits' skill indices
+        # are tallied by Counter in a single C-level pass
+        hits = [keyword in text for keyword in self._KEYWORDS]
+        scores = Counter(chain.from_iterable(compress(self._KEYWORD_SKILL_IDS, hits)))
+
+        # Sort by score (descending, ties in SKILLS order) and return skill names
+        matched_skills = sorted(scores, key=lambda skill_idx: (-scores[skill_idx], skill_idx))
+
+        # Matched skills, then the core architecture skills that are always
+        # included for substantial features; dict.fromkeys drops repeats
+        # while keeping first-seen order
+        names = self._SKILL_NAMES
+        result = dict.fromkeys(names[skill_idx] for skill_idx in matched_skills)
+        result.update(dict.fromkeys(_CORE_SKILLS))
+
+        return list(result)[:10]  # Return top 10 skills
+
+
+# Matching lowercases only the text; keywords must already be lowercase
+assert all(
+    keyword == keyword.lower()
+    for skill in AndroidSkillMatcher.SKILLS.values()
+    for keyword in skill["keywords"]
+)
+
+# (category, description) per skill, so output code does one lookup per
+# skill instead of two chained .get() calls into SKILLS
+_SKILL_INFO: Dict[str, Tuple[str, str]] = {
+    name: (skill["category"], skill["description"])
+    for name, skill in AndroidSkillMatcher.SKILLS.items()
+}
+_UNKNOWN_SKILL = ("Unknown", "")
 
-            if score > 0:
-                matched_skills.append((skill_name, score))
 
-        # Sort by score (descending) and return skill names
-        matched_skills.sort(key=lambda x: x[1], reverse=True)
+class ReqType(IntEnum):
+    """EARS requirement types, in SPEC section order.
 
-        # Always include core architecture skills for substantial features
-        core_skills = ["android-clean-architecture", "android-mvvm-architecture", "android-compose-ui"]
-        result = []
+    Values double as list indices for per-type buckets; the member name is
+    the letter used in requirement IDs.
+    """
+    U = 0  # Ubiquitous
+    S = 1  # State-driven
+    E = 2  # Event-driven
+    O = 3  # Optional
+    N = 4  # Unwanted
 
-        # Add matched skills
-        for skill, _ in matched_skills:
-            if skill not in result:
-                result.append(skill)
 
-        # Add core skills if not already included
-        for core_skill in core_skills:
-            if core_skill not in result:
-                result.append(core_skill)
+# Section title and format hint for each ReqType, indexed by its value
+_REQ_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("Ubiquitous Requirements (Core Functionality)", "The system shall [requirement]"),
+    ("State-Driven Requirements", "WHILE [state], the system shall [requirement]"),
+    ("Event-Driven Requirements", "WHEN [trigger event], the system shall [requirement]"),
+    ("Optional Requirements", "WHERE [feature is enabled], the system shall [requirement]"),
+    ("Unwanted Behaviors", "IF [condition], THEN the system shall NOT [unwanted behavior]"),
+)
+
 
-        return result[:10]  # Return top 10 skills
+# EARS category of a lowercased requirement in one anchored match. Each
+# branch looks ahead through the whole text for its keywords, and branches
+# are tried in priority order (event > state > unwanted > optional), so a
+# requirement mentioning both "while" and "when" is still event-driven.
+_REQ_CATEGORY_RE = re.compile(
+    r'(?=.*?(?:when|on click|on tap|trigger|event))(?P<E>)'
+    r'|(?=.*?(?:while|during|in state))(?P<S>)'
+    r'|(?=.*?(?:shall not|must not|cannot|should not))(?P<N>)'
+    r'|(?=.*?(?:optional|if enabled|where available))(?P<O>)',
+    re.DOTALL
+)
 
 
 class EARSRequirementGenerator:
@@ -305,45 +413,215 @@ class EARSRequirementGenerator:
         return f"REQ-{spec_id}-{req_type}-{number:02d}"
 
     @staticmethod
-    def categorize_requirement(requirement: str) -> Tuple[str, str]:
+    def categorize_requirement(requirement: str) -> Tuple[ReqType, str]:
         """Categorize a requirement into EARS format.
 
         Args:
             requirement: Requirement description
 
         Returns:
-            Tuple of (requirement_type, formatted_requirement)
+            Tuple of (ReqType, formatted_requirement)
         """
-        req_lower = requirement.lower()
+        match = _REQ_CATEGORY_RE.match(requirement.lower())
+        category = match.lastgroup if match else None
 
         # Event-driven patterns
-        if any(word in req_lower for word in ["when", "on click", "on tap", "trigger", "event"]):
+        if category == "E":
             if not requirement.startswith("WHEN"):
-                return "E", f"WHEN [trigger event], the system shall {requirement}"
-            return "E", requirement
+                return ReqType.E, f"WHEN [trigger event], the system shall {requirement}"
+            return ReqType.E, requirement
 
         # State-driven patterns
-        if any(word in req_lower for word in ["while", "during", "in state"]):
+        if category == "S":
             if not requirement.startswith("WHILE"):
-                return "S", f"WHILE [in specific state], the system shall {requirement}"
-            return "S", requirement
+                return ReqType.S, f"WHILE [in specific state], the system shall {requirement}"
+            return ReqType.S, requirement
 
         # Unwanted behaviors
-        if any(word in req_lower for word in ["shall not", "must not", "cannot", "should not"]):
+        if category == "N":
             if not requirement.startswith("IF"):
-                return "N", f"IF [condition], THEN the system shall NOT {requirement}"
-            return "N", requirement
+                return ReqType.N, f"IF [condition], THEN the system shall NOT {requirement}"
+            return ReqType.N, requirement
 
         # Optional features
-        if any(word in req_lower for word in ["optional", "if enabled", "where available"]):
+        if category == "O":
             if not requirement.startswith("WHERE"):
-                return "O", f"WHERE [feature is enabled], the system shall {requirement}"
-            return "O", requirement
+                return ReqType.O, f"WHERE [feature is enabled], the system shall {requirement}"
+            return ReqType.O, requirement
 
         # Default: Ubiquitous requirement
         if not requirement.startswith("The system shall"):
-            return "U", f"The system shall {requirement}"
-        return "U", requirement
+            return ReqType.U, f"The system shall {requirement}"
+        return ReqType.U, requirement
+
+
+# SPEC.md scaffold. Static sections are parsed once here; the per-SPEC
+# blocks (${related_skills}, ${requirements}, ${skill_list},
+# ${matrix_rows}) are built by _generate_spec_content.
+_SPEC_TEMPLATE = string.Template("""---
+spec_id: SPEC-$spec_id
+feature: $feature_name
+status: draft
+version: 1.0.0
+author: $author
+date: $today
+related_skills:
+${related_skills}traceability:
+  requirements: []
+  code_files: []
+  test_files: []
+---
+
+# $feature_name Specification
+
+## 1. Overview
+
+**Purpose**: $purpose
+
+**Scope**:
+- In Scope: [To be defined]
+- Out of Scope: [To be defined]
+
+**Dependencies**:
+- External: [To be defined]
+- Internal: [To be defined]
+
+---
+
+## 2. Requirements (EARS Format)
+
+${requirements}---
+
+## 3. User Stories
+
+### Story 1: [User Story Title]
+**As a** [user type]
+**I want** [goal/desire]
+**So that** [benefit/value]
+
+**Acceptance Criteria**:
+- [ ] Given [precondition], when [action], then [expected result]
+
+**Related Requirements**: [REQ IDs]
+
+---
+
+## 4. Architecture (Clean Architecture)
+
+### 4.1 Domain Layer
+
+**Models**:
+```kotlin
+data class [ModelName](
+    val id: String,
+    // Add properties based on requirements
+)
+```
+
+**Use Cases**:
+- `Get[Entity]UseCase`: [Description]
+- `Create[Entity]UseCase`: [Description]
+
+**Repository Interfaces**:
+```kotlin
+interface [Entity]Repository {
+    suspend fun get[Entity](id: String): Result<[Entity]>
+}
+```
+
+### 4.2 Data Layer
+
+**API Endpoints**:
+- `GET /api/[endpoint]`: [Description]
+- `POST /api/[endpoint]`: [Description]
+
+**Database Schema**:
+```kotlin
+@Entity(tableName = "[table_name]")
+data class [Entity]Entity(
+    @PrimaryKey val id: String,
+    // Fields
+)
+```
+
+### 4.3 Presentation Layer
+
+**Screens**:
+- `[Feature]Screen.kt`: [Description]
+
+**ViewModels**:
+```kotlin
+@HiltViewModel
+class [Feature]ViewModel @Inject constructor() : ViewModel() {
+    // Implementation
+}
+```
+
+---
+
+## 5. Related Skills
+
+This feature uses the following Android skills:
+
+${skill_list}
+---
+
+## 6. Implementation Checklist
+
+### Domain Layer
+- [ ] Define domain models
+- [ ] Create use cases
+- [ ] Define repository interfaces
+
+### Data Layer
+- [ ] Implement API service
+- [ ] Create database entities
+- [ ] Implement repository
+
+### Presentation Layer
+- [ ] Create ViewModel
+- [ ] Define State, Actions, Events
+- [ ] Implement UI screens
+
+### Testing
+- [ ] Write unit tests (85%+ coverage)
+- [ ] Write UI tests
+- [ ] Write integration tests
+
+### Documentation
+- [ ] Update README
+- [ ] Add code comments with SPEC IDs
+- [ ] Generate documentation
+
+---
+
+## 7. Traceability Matrix
+
+| Requirement | Code File | Test File | Status |
+|-------------|-----------|-----------|--------|
+${matrix_rows}
+**Legend**: ⏳ Pending | 🟢 Implemented | ✅ Tested | ❌ Failed
+
+---
+
+## 8. Notes & Considerations
+
+### Next Steps
+1. Review and refine requirements
+2. Define detailed user stories
+3. Design data models
+4. Begin implementation
+
+### Questions to Resolve
+- [Question 1]
+- [Question 2]
+
+---
+
+**Document Version**: 1.0.0
+**Last Updated**: $today
+**Status**: Draft - Ready for review
+""")
 
 
 class SpecBuilder:
@@ -375,36 +653,64 @@ class SpecBuilder:
             if spec_dir.is_dir():
                 spec_file = spec_dir / "SPEC.md"
                 if spec_file.exists():
-                    # Extract SPEC ID from frontmatter
-                    with open(spec_file, 'r') as f:
-                        content = f.read()
-                        match = re.search(r'spec_id:\s*SPEC-(\d+)', content)
-                        if match:
-                            spec_ids.append(int(match.group(1)))
+                    spec_number = self._read_spec_number(spec_file)
+                    if spec_number is not None:
+                        spec_ids.append(spec_number)
 
         next_id = max(spec_ids) + 1 if spec_ids else 1
         return f"{next_id:03d}"
 
+    @staticmethod
+    def _read_spec_number(spec_file: Path) -> Optional[int]:
+        """Read the SPEC number from a SPEC.md frontmatter.
+
+        spec_id sits at the top of the frontmatter, so only the head of the
+        file is read and scanned with plain string operations.
+
+        Args:
+            spec_file: Path to SPEC.md
+
+        Returns:
+            Number from 'spec_id: SPEC-NNN', or None if absent
+        """
+        with open(spec_file, 'rb') as f:
+            head = f.read(_SPEC_HEAD_BYTES)
+
+        start = head.find(b"spec_id:")
+        if start == -1:
+            return None
+
+        value = head[start + len(b"spec_id:"):].lstrip()
+        if not value.startswith(b"SPEC-"):
+            return None
+
+        digits = value[len(b"SPEC-"):]
+        end = 0
+        while end < len(digits) and digits[end:end + 1].isdigit():
+            end += 1
+        return int(digits[:end]) if end else None
+
     def interactive_mode(self):
         """Run interactive SPEC creation mode."""
         print(f"\n{Colors.HEADER}{Colors.BOLD}=== SPEC Builder - Interactive Mode ==={Colors.ENDC}\n")
+        read_line = _prompt_reader()
 
         # Step 1: Feature name
         print(f"{Colors.OKCYAN}Step 1: Feature Information{Colors.ENDC}")
-        feature_name = input(f"{Colors.BOLD}Feature name:{Colors.ENDC} ").strip()
+        feature_name = read_line(f"{Colors.BOLD}Feature name:{Colors.ENDC} ").strip()
         if not feature_name:
             print(f"{Colors.FAIL}Error: Feature name is required{Colors.ENDC}")
             return
 
         # Step 2: Purpose
-        purpose = input(f"{Colors.BOLD}Purpose (why this feature):{Colors.ENDC} ").strip()
+        purpose = read_line(f"{Colors.BOLD}Purpose (why this feature):{Colors.ENDC} ").strip()
 
         # Step 3: Requirements
         print(f"\n{Colors.OKCYAN}Step 2: Requirements{Colors.ENDC}")
         print("Enter requirements (one per line). Type 'done' when finished:")
         requirements = []
         while True:
-            req = input(f"{Colors.BOLD}{len(requirements) + 1}.{Colors.ENDC} ").strip()
+            req = read_line(f"{Colors.BOLD}{len(requirements) + 1}.{Colors.ENDC} ").strip()
             if req.lower() == 'done':
                 break
             if req:
@@ -420,14 +726,12 @@ class SpecBuilder:
 
         print(f"\n{Colors.OKGREEN}Found {len(matched_skills)} related skills:{Colors.ENDC}")
         for i, skill in enumerate(matched_skills, 1):
-            skill_info = self.skill_matcher.SKILLS.get(skill, {})
-            category = skill_info.get("category", "Unknown")
-            desc = skill_info.get("description", "")
+            category, desc = _SKILL_INFO.get(skill, _UNKNOWN_SKILL)
             print(f"  {i}. {skill} ({category}): {desc}")
 
         # Step 5: Confirm
         print(f"\n{Colors.OKCYAN}Step 4: Confirmation{Colors.ENDC}")
-        confirm = input(f"{Colors.BOLD}Generate SPEC with these details? (y/n):{Colors.ENDC} ").strip().lower()
+        confirm = read_line(f"{Colors.BOLD}Generate SPEC with these details? (y/n):{Colors.ENDC} ").strip().lower()
 
         if confirm != 'y':
             print(f"{Colors.WARNING}Cancelled{Colors.ENDC}")
@@ -469,30 +773,22 @@ class SpecBuilder:
 
         spec_file = spec_dir / "SPEC.md"
 
-        # Categorize requirements
-        categorized_reqs = {
-            "U": [],  # Ubiquitous
-            "S": [],  # State-driven
-            "E": [],  # Event-driven
-            "O": [],  # Optional
-            "N": [],  # Unwanted
-        }
+        # Categorize requirements into one bucket per ReqType
+        categorized_reqs: List[List[str]] = [[] for _ in ReqType]
 
         for req in requirements:
             req_type, formatted_req = self.ears_generator.categorize_requirement(req)
             categorized_reqs[req_type].append(formatted_req)
 
-        # Generate requirement IDs
+        # Generate requirement IDs, numbered per type
         ears_requirements = []
-        req_number = {"U": 1, "S": 1, "E": 1, "O": 1, "N": 1}
 
-        for req_type in ["U", "S", "E", "O", "N"]:
-            for req in categorized_reqs[req_type]:
+        for req_type in ReqType:
+            for number, req in enumerate(categorized_reqs[req_type], 1):
                 req_id = self.ears_generator.generate_requirement_id(
-                    spec_id, req_type, req_number[req_type]
+                    spec_id, req_type.name, number
                 )
                 ears_requirements.append((req_id, req_type, req))
-                req_number[req_type] += 1
 
         # Generate SPEC content
         content = self._generate_spec_content(
@@ -504,9 +800,11 @@ class SpecBuilder:
             author=author
         )
 
-        # Write SPEC file
-        with open(spec_file, 'w') as f:
-            f.write(content)
+        # Write SPEC file: encode once, write in one call, then rename into
+        # place so an interrupted run never leaves a truncated SPEC.md
+        tmp_file = spec_file.with_name(f".{spec_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(content.encode('utf-8'))
+        os.replace(tmp_file, spec_file)
 
         print(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ SPEC created successfully!{Colors.ENDC}")
         print(f"{Colors.OKBLUE}Location: {spec_file}{Colors.ENDC}")
@@ -519,7 +817,7 @@ class SpecBuilder:
         spec_id: str,
         feature_name: str,
         purpose: str,
-        ears_requirements: List[Tuple[str, str, str]],
+        ears_requirements: List[Tuple[str, ReqType, str]],
         matched_skills: List[str],
         author: str
     ) -> str:
@@ -536,230 +834,138 @@ class SpecBuilder:
         Returns:
             SPEC document content
         """
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Frontmatter
-        content = f"""---
-spec_id: SPEC-{spec_id}
-feature: {feature_name}
-status: draft
-version: 1.0.0
-author: {author}
-date: {today}
-related_skills:
-"""
-        for skill in matched_skills:
-            content += f"  - {skill}\n"
-
-        content += """traceability:
-  requirements: []
-  code_files: []
-  test_files: []
----
-
-"""
-
-        # Title and Overview
-        content += f"""# {feature_name} Specification
-
-## 1. Overview
-
-**Purpose**: {purpose}
-
-**Scope**:
-- In Scope: [To be defined]
-- Out of Scope: [To be defined]
-
-**Dependencies**:
-- External: [To be defined]
-- Internal: [To be defined]
-
----
-
-## 2. Requirements (EARS Format)
-
-"""
+        # Local date, as datetime.now() gave, without building a datetime
+        today = time.strftime("%Y-%m-%d", time.localtime())
 
         # Group requirements by type
-        req_by_type = {
-            "U": ("Ubiquitous Requirements (Core Functionality)", []),
-            "S": ("State-Driven Requirements", []),
-            "E": ("Event-Driven Requirements", []),
-            "O": ("Optional Requirements", []),
-            "N": ("Unwanted Behaviors", []),
-        }
+        reqs_by_type: List[List[Tuple[str, str]]] = [[] for _ in ReqType]
 
         for req_id, req_type, req in ears_requirements:
-            req_by_type[req_type][1].append((req_id, req))
+            reqs_by_type[req_type].append((req_id, req))
 
-        # Write requirements
-        for req_type, (section_title, reqs) in req_by_type.items():
+        # Requirement sections, in EARS type order
+        parts = []
+        for req_type in ReqType:
+            reqs = reqs_by_type[req_type]
             if reqs:
-                content += f"""### 2.{list(req_by_type.keys()).index(req_type) + 1} {section_title}
-"""
-                if req_type == "U":
-                    content += "*Format: \"The system shall [requirement]\"*\n\n"
-                elif req_type == "S":
-                    content += "*Format: \"WHILE [state], the system shall [requirement]\"*\n\n"
-                elif req_type == "E":
-                    content += "*Format: \"WHEN [trigger event], the system shall [requirement]\"*\n\n"
-                elif req_type == "O":
-                    content += "*Format: \"WHERE [feature is enabled], the system shall [requirement]\"*\n\n"
-                elif req_type == "N":
-                    content += "*Format: \"IF [condition], THEN the system shall NOT [unwanted behavior]\"*\n\n"
+                section_title, req_format = _REQ_SECTIONS[req_type]
+                parts.append(f"### 2.{req_type + 1} {section_title}\n")
+                parts.append(f"*Format: \"{req_format}\"*\n\n")
 
                 for req_id, req in reqs:
-                    content += f"- **{req_id}**: {req}\n"
-
-                content += "\n"
-
-        # User Stories (template)
-        content += """---
-
-## 3. User Stories
-
-### Story 1: [User Story Title]
-**As a** [user type]
-**I want** [goal/desire]
-**So that** [benefit/value]
-
-**Acceptance Criteria**:
-- [ ] Given [precondition], when [action], then [expected result]
-
-**Related Requirements**: [REQ IDs]
-
----
-
-## 4. Architecture (Clean Architecture)
-
-### 4.1 Domain Layer
-
-**Models**:
-```kotlin
-data class [ModelName](
-    val id: String,
-    // Add properties based on requirements
-)
-```
+                    parts.append(f"- **{req_id}**: {req}\n")
 
-**Use Cases**:
-- `Get[Entity]UseCase`: [Description]
-- `Create[Entity]UseCase`: [Description]
-
-**Repository Interfaces**:
-```kotlin
-interface [Entity]Repository {
-    suspend fun get[Entity](id: String): Result<[Entity]>
-}
-```
-
-### 4.2 Data Layer
+                parts.append("\n")
 
-**API Endpoints**:
-- `GET /api/[endpoint]`: [Description]
-- `POST /api/[endpoint]`: [Description]
-
-**Database Schema**:
-```kotlin
-@Entity(tableName = "[table_name]")
-data class [Entity]Entity(
-    @PrimaryKey val id: String,
-    // Fields
-)
-```
-
-### 4.3 Presentation Layer
-
-**Screens**:
-- `[Feature]Screen.kt`: [Description]
-
-**ViewModels**:
-```kotlin
-@HiltViewModel
-class [Feature]ViewModel @Inject constructor() : ViewModel() {
-    // Implementation
-}
-```
-
----
-
-## 5. Related Skills
-
-This feature uses the following Android skills:
-
-"""
-
-        for skill in matched_skills:
-            skill_info = self.skill_matcher.SKILLS.get(skill, {})
-            desc = skill_info.get("description", "")
-            content += f"- `{skill}`: {desc}\n"
-
-        content += """
----
-
-## 6. Implementation Checklist
-
-### Domain Layer
-- [ ] Define domain models
-- [ ] Create use cases
-- [ ] Define repository interfaces
-
-### Data Layer
-- [ ] Implement API service
-- [ ] Create database entities
-- [ ] Implement repository
-
-### Presentation Layer
-- [ ] Create ViewModel
-- [ ] Define State, Actions, Events
-- [ ] Implement UI screens
-
-### Testing
-- [ ] Write unit tests (85%+ coverage)
-- [ ] Write UI tests
-- [ ] Write integration tests
+        return _SPEC_TEMPLATE.substitute(
+            spec_id=spec_id,
+            feature_name=feature_name,
+            purpose=purpose,
+            author=author,
+            today=today,
+            related_skills="".join(f"  - {skill}\n" for skill in matched_skills),
+            requirements="".join(parts),
+            skill_list="".join(
+                f"- `{skill}`: {_SKILL_INFO.get(skill, _UNKNOWN_SKILL)[1]}\n"
+                for skill in matched_skills
+            ),
+            matrix_rows="".join(
+                f"| {req_id} | [TBD] | [TBD] | ⏳ Pending |\n"
+                for req_id, _, _ in ears_requirements
+            ),
+        )
 
-### Documentation
-- [ ] Update README
-- [ ] Add code comments with SPEC IDs
-- [ ] Generate documentation
 
----
+# Start directory -> project root found from it. Only hits are cached, so a
+# .claude directory created later in the same process is still picked up.
+_PROJECT_ROOTS: Dict[str, Path] = {}
 
-## 7. Traceability Matrix
 
-| Requirement | Code File | Test File | Status |
-|-------------|-----------|-----------|--------|
-"""
-
-        for req_id, _, _ in ears_requirements:
-            content += f"| {req_id} | [TBD] | [TBD] | ⏳ Pending |\n"
+def find_project_root(start: Optional[Path] = None) -> Optional[Path]:
+    """Find the nearest directory containing a .claude directory.
 
-        content += """
-**Legend**: ⏳ Pending | 🟢 Implemented | ✅ Tested | ❌ Failed
+    $AIDK_PROJECT_ROOT, when set, is used as-is without searching.
 
----
+    Args:
+        start: Directory to start searching from (defaults to cwd)
 
-## 8. Notes & Considerations
+    Returns:
+        Project root, or None if no .claude directory was found
+    """
+    env_root = os.environ.get("AIDK_PROJECT_ROOT")
+    if env_root:
+        return Path(env_root)
 
-### Next Steps
-1. Review and refine requirements
-2. Define detailed user stories
-3. Design data models
-4. Begin implementation
+    start = start or Path.cwd()
+    key = str(start)
+    cached = _PROJECT_ROOTS.get(key)
+    if cached is not None:
+        return cached
 
-### Questions to Resolve
-- [Question 1]
-- [Question 2]
-
----
+    project_root = start
+    while project_root != project_root.parent:
+        if os.path.exists(os.path.join(project_root, ".claude")):
+            _PROJECT_ROOTS[key] = project_root
+            return project_root
+        project_root = project_root.parent
+    return None
 
-**Document Version**: 1.0.0
-**Last Updated**: """ + today + """
-**Status**: Draft - Ready for review
-"""
 
-        return content
+def _load_builder() -> Optional[SpecBuilder]:
+    """Create a SpecBuilder for the current project, reporting a missing root."""
+    project_root = find_project_root()
+    if project_root is None:
+        print(f"{Colors.FAIL}Error: Could not find project root (no .claude directory){Colors.ENDC}")
+        return None
+    return SpecBuilder(project_root)
+
+
+def create(
+    feature_name: str,
+    *,
+    purpose: Optional[str] = None,
+    requirements: Sequence[str] = ()
+) -> int:
+    """Create a SPEC document for the project containing the cwd.
+
+    Args:
+        feature_name: Feature name
+        purpose: Feature purpose
+        requirements: Requirement descriptions
+
+    Returns:
+        Exit code (0 on success)
+    """
+    builder = _load_builder()
+    if builder is None:
+        return 1
+
+    spec_id = builder.get_next_spec_id()
+    requirements = list(requirements) or ["Define requirements"]
+    matched_skills = builder.skill_matcher.match_skills(feature_name, requirements)
+
+    builder.create_spec(
+        spec_id=spec_id,
+        feature_name=feature_name,
+        purpose=purpose or "To be defined",
+        requirements=requirements,
+        matched_skills=matched_skills
+    )
+    return 0
+
+
+def interactive() -> int:
+    """Run interactive SPEC creation for the project containing the cwd.
+
+    Returns:
+        Exit code (0 on success)
+    """
+    builder = _load_builder()
+    if builder is None:
+        return 1
+
+    builder.interactive_mode()
+    return 0
 
 
 def main():
@@ -778,35 +984,17 @@ def main():
 
     args = parser.parse_args()
 
-    # Find project root
-    current_dir = Path.cwd()
-    project_root = current_dir
-    while project_root != project_root.parent:
-        if (project_root / ".claude").exists():
-            break
-        project_root = project_root.parent
+    if args.command == "create":
+        exit_code = create(
+            args.feature_name,
+            purpose=args.purpose,
+            requirements=args.requirements or ()
+        )
     else:
-        print(f"{Colors.FAIL}Error: Could not find project root (no .claude directory){Colors.ENDC}")
-        sys.exit(1)
-
-    builder = SpecBuilder(project_root)
-
-    if args.command == "interactive" or args.command is None:
-        builder.interactive_mode()
-    elif args.command == "create":
-        # Quick create mode
-        spec_id = builder.get_next_spec_id()
-        purpose = args.purpose or "To be defined"
-        requirements = args.requirements or ["Define requirements"]
-        matched_skills = builder.skill_matcher.match_skills(args.feature_name, requirements)
+        exit_code = interactive()
 
-        builder.create_spec(
-            spec_id=spec_id,
-            feature_name=args.feature_name,
-            purpose=purpose,
-            requirements=requirements,
-            matched_skills=matched_skills
-        )
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -10,10 +10,14 @@ Usage:
 """
 
 import argparse
+import contextlib
+import io
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Tuple
 
 # ANSI colors
 class Colors:
@@ -24,6 +28,25 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Patterns shared by every SpecValidator, compiled once per process rather
+# than looked up in re's cache on each call. Section names are still found
+# with plain `in` checks, which measured faster than one combined regex or
+# a line-by-line header scan over the same content
+_PATTERNS = {
+    'frontmatter': re.compile(r'^---\n(.*?)\n---', re.DOTALL),
+    'related_skills': re.compile(r'related_skills:\n((?:  - .*\n)*)'),
+    'requirement': re.compile(r'-\s+\*\*([A-Z0-9-]+)\*\*:\s+(.+)'),
+    'requirement_id': re.compile(r'REQ-\d+-[USEON]-\d+'),
+    'spec_id': re.compile(r'spec_id:\s*SPEC-(\d+)'),
+}
+
+
+# Below this many files a process pool costs more to start than validating
+# everything in-process (~60us per SPEC)
+_PARALLEL_MIN_FILES = 256
+_PARALLEL_CHUNKSIZE = 32
+
+
 class SpecValidator:
     """Validates SPEC documents."""
 
@@ -87,7 +110,7 @@ class SpecValidator:
 
     def _validate_frontmatter(self, content: str):
         """Validate YAML frontmatter."""
-        frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
+        frontmatter_match = _PATTERNS['frontmatter'].search(content)
 
         if not frontmatter_match:
             self.errors.append("Missing YAML frontmatter")
@@ -102,7 +125,7 @@ class SpecValidator:
 
         # Validate related_skills format
         if 'related_skills:' in frontmatter:
-            skills_match = re.search(r'related_skills:\n((?:  - .*\n)*)', frontmatter)
+            skills_match = _PATTERNS['related_skills'].search(frontmatter)
             if not skills_match:
                 self.warnings.append("No skills listed in related_skills")
 
@@ -115,21 +138,21 @@ class SpecValidator:
     def _validate_requirements(self, content: str):
         """Validate requirements format."""
         # Find requirements
-        req_pattern = r'-\s+\*\*([A-Z0-9-]+)\*\*:\s+(.+)'
-        requirements = re.findall(req_pattern, content)
+        requirements = _PATTERNS['requirement'].findall(content)
 
         if not requirements:
             self.warnings.append("No requirements found")
             return
 
         # Validate requirement IDs
+        standard_id = _PATTERNS['requirement_id'].match
         for req_id, _ in requirements:
             if not req_id.startswith('REQ-'):
                 self.errors.append(f"Invalid requirement ID format: {req_id}")
                 continue
 
             # Format: REQ-XXX-Y-ZZ
-            if not re.match(r'REQ-\d+-[USEON]-\d+', req_id):
+            if not standard_id(req_id):
                 self.warnings.append(f"Non-standard requirement ID format: {req_id}")
 
         # Check for EARS format
@@ -145,7 +168,7 @@ class SpecValidator:
 
     def _validate_spec_id(self, content: str):
         """Validate SPEC ID format."""
-        spec_id_match = re.search(r'spec_id:\s*SPEC-(\d+)', content)
+        spec_id_match = _PATTERNS['spec_id'].search(content)
 
         if not spec_id_match:
             self.errors.append("Invalid SPEC ID format")
@@ -158,25 +181,98 @@ class SpecValidator:
             self.warnings.append(f"SPEC ID SPEC-{spec_id} not referenced in document")
 
     def _print_results(self):
-        """Print validation results."""
-        print(f"\n{Colors.BOLD}Validating: {self.spec_file}{Colors.ENDC}\n")
+        """Print validation results.
+
+        The report is assembled first and written with one call, rather
+        than one write per line.
+        """
+        lines = [f"\n{Colors.BOLD}Validating: {self.spec_file}{Colors.ENDC}\n"]
 
         if self.errors:
-            print(f"{Colors.FAIL}{Colors.BOLD}Errors:{Colors.ENDC}")
+            lines.append(f"{Colors.FAIL}{Colors.BOLD}Errors:{Colors.ENDC}")
             for error in self.errors:
-                print(f"  {Colors.FAIL}✗{Colors.ENDC} {error}")
+                lines.append(f"  {Colors.FAIL}✗{Colors.ENDC} {error}")
 
         if self.warnings:
-            print(f"\n{Colors.WARNING}{Colors.BOLD}Warnings:{Colors.ENDC}")
+            lines.append(f"\n{Colors.WARNING}{Colors.BOLD}Warnings:{Colors.ENDC}")
             for warning in self.warnings:
-                print(f"  {Colors.WARNING}⚠{Colors.ENDC} {warning}")
+                lines.append(f"  {Colors.WARNING}⚠{Colors.ENDC} {warning}")
 
         if not self.errors and not self.warnings:
-            print(f"{Colors.OKGREEN}{Colors.BOLD}✓ SPEC is valid!{Colors.ENDC}")
+            lines.append(f"{Colors.OKGREEN}{Colors.BOLD}✓ SPEC is valid!{Colors.ENDC}")
         elif not self.errors:
-            print(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ SPEC is valid (with warnings){Colors.ENDC}")
+            lines.append(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ SPEC is valid (with warnings){Colors.ENDC}")
         else:
-            print(f"\n{Colors.FAIL}{Colors.BOLD}✗ SPEC validation failed{Colors.ENDC}")
+            lines.append(f"\n{Colors.FAIL}{Colors.BOLD}✗ SPEC validation failed{Colors.ENDC}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _validate_one(spec_file: Path) -> Tuple[bool, str]:
+    """Validate one SPEC file in a worker process, capturing its report.
+
+    Args:
+        spec_file: Path to SPEC.md
+
+    Returns:
+        (is_valid, printed report) so the parent can print reports in order
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        is_valid = SpecValidator(Path(spec_file)).validate()
+        print()
+    return is_valid, buffer.getvalue()
+
+
+def validate(spec_files: Iterable[Path]) -> int:
+    """Validate SPEC files and print results for each.
+
+    Large batches are spread over a process pool; reports are still
+    printed in input order.
+
+    Args:
+        spec_files: SPEC.md paths to validate
+
+    Returns:
+        Exit code (0 if every file is valid)
+    """
+    spec_files = list(spec_files)
+
+    all_valid = True
+    if len(spec_files) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            for is_valid, report in executor.map(_validate_one, spec_files, chunksize=_PARALLEL_CHUNKSIZE):
+                sys.stdout.write(report)
+                if not is_valid:
+                    all_valid = False
+    else:
+        for spec_file in spec_files:
+            validator = SpecValidator(Path(spec_file))
+            if not validator.validate():
+                all_valid = False
+            print()
+
+    return 0 if all_valid else 1
+
+
+def find_spec_files(specs_dir: Path) -> List[Path]:
+    """Find every SPEC.md under a specs directory.
+
+    Same files and order as specs_dir.rglob("SPEC.md") (directories in
+    pre-order, symlinked directories not followed), but os.walk tests each
+    directory's name list instead of matching every entry against a glob.
+
+    Args:
+        specs_dir: Directory to search
+
+    Returns:
+        Paths to SPEC.md files
+    """
+    return [
+        Path(root, "SPEC.md")
+        for root, _, files in os.walk(specs_dir)
+        if "SPEC.md" in files
+    ]
 
 
 def main():
@@ -187,21 +283,22 @@ def main():
 
     args = parser.parse_args()
 
-    # Find project root
-    current_dir = Path.cwd()
-    project_root = current_dir
-    while project_root != project_root.parent:
-        if (project_root / ".claude").exists():
+    # Find project root, climbing with plain path strings; Path is only
+    # built for the directory found
+    current_dir = os.getcwd()
+    while current_dir != os.path.dirname(current_dir):
+        if os.path.exists(os.path.join(current_dir, ".claude")):
             break
-        project_root = project_root.parent
+        current_dir = os.path.dirname(current_dir)
     else:
         print(f"{Colors.FAIL}Error: Could not find project root{Colors.ENDC}")
         sys.exit(1)
+    project_root = Path(current_dir)
 
     # Determine files to validate
     if args.all:
         specs_dir = project_root / "specs" / "examples"
-        spec_files = list(specs_dir.rglob("SPEC.md"))
+        spec_files = find_spec_files(specs_dir)
         if not spec_files:
             print(f"{Colors.WARNING}No SPEC files found{Colors.ENDC}")
             sys.exit(0)
@@ -211,15 +308,7 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    # Validate files
-    all_valid = True
-    for spec_file in spec_files:
-        validator = SpecValidator(spec_file)
-        if not validator.validate():
-            all_valid = False
-        print()
-
-    sys.exit(0 if all_valid else 1)
+    sys.exit(validate(spec_files))
 
 
 if __name__ == "__main__":